@@ -5,6 +5,7 @@ import logging
 from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
 import aiohttp
 import async_timeout
+from homeassistant.util.json import json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,7 +54,7 @@ class GuardianApiClient:
                 )
 
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=json_loads)
                     _LOGGER.info("OAuth flow started successfully")
                     return data
                 else:
@@ -85,7 +86,7 @@ class GuardianApiClient:
                 )
 
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=json_loads)
                     self._session_id = data.get("session_id")
                     _LOGGER.info("OAuth authentication successful")
                     return True
@@ -115,7 +116,7 @@ class GuardianApiClient:
                 )
 
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=json_loads)
                     self._session_id = data.get("session_id")
                     _LOGGER.info("Authentication successful")
                     return True
@@ -135,9 +136,14 @@ class GuardianApiClient:
         self,
         method: str,
         endpoint: str,
-        data: Optional[Dict[str, Any]] = None
+        data: Optional[Dict[str, Any]] = None,
+        raise_errors: bool = False
     ) -> Optional[Dict[str, Any]]:
-        """Make an API request."""
+        """Make an API request.
+
+        Connection errors and timeouts are logged and return None, unless
+        raise_errors is set (so callers can retry them).
+        """
         if not self._session_id:
             _LOGGER.error("Not authenticated")
             return None
@@ -172,7 +178,7 @@ class GuardianApiClient:
                     return None
 
                 if response.status == 200:
-                    return await response.json()
+                    return await response.json(loads=json_loads)
                 elif response.status == 401:
                     _LOGGER.warning("Session expired")
                     self._session_id = None
@@ -183,15 +189,22 @@ class GuardianApiClient:
                     return None
 
         except aiohttp.ClientError as e:
+            if raise_errors:
+                raise
             _LOGGER.error(f"Connection error: {e}")
             return None
+        except asyncio.TimeoutError:
+            if raise_errors:
+                raise
+            _LOGGER.error(f"Request timed out after {self._timeout}s")
+            return None
         except Exception as e:
             _LOGGER.error(f"Request error: {e}")
             return None
 
-    async def get_devices(self) -> List[Dict[str, Any]]:
-        """Get list of devices."""
-        result = await self._request("GET", "/api/v1/devices")
+    async def get_devices(self, raise_errors: bool = False) -> List[Dict[str, Any]]:
+        """Get list of devices (see `_request` for raise_errors)."""
+        result = await self._request("GET", "/api/v1/devices", raise_errors=raise_errors)
         if result:
             return result.get("devices", [])
         return []
@@ -305,7 +318,7 @@ class GuardianApiClient:
                 else:
                     return {"success": False, "error": "Método não suportado"}
 
-                response_data = await response.json()
+                response_data = await response.json(loads=json_loads)
 
                 if response.status == 200:
                     return response_data
@@ -507,7 +520,7 @@ class GuardianApiClient:
                             data_str = line[5:].strip()
                             if data_str:
                                 try:
-                                    event_data = json.loads(data_str)
+                                    event_data = json_loads(data_str)
                                     event_type = event_data.get("event_type", "")
 
                                     # Only process alarm events
@@ -26,8 +26,9 @@ async def async_setup_entry(
     coordinator: GuardianCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     entities = []
-    # Track which battery sensors have been created (by unique_id)
-    created_battery_sensors: set[str] = set()
+    # Track which battery sensors have been created, keyed by
+    # (device_mac, zone_index) so the listener needs no string formatting
+    created_battery_sensors: set[tuple[str, int]] = set()
 
     if coordinator.data:
         for zone in coordinator.data.get("zones", []):
@@ -43,8 +44,7 @@ async def async_setup_entry(
             # Add battery sensor for wireless zones already known
             if zone.get("is_wireless"):
                 zone_index = zone.get("index", zone.get("id", 0))
-                uid = f"{zone.get('device_mac', '')}_zone_{zone_index}_battery"
-                created_battery_sensors.add(uid)
+                created_battery_sensors.add((zone.get("device_mac", ""), zone_index))
                 entities.append(
                     GuardianZoneBatterySensor(
                         coordinator,
@@ -62,12 +62,12 @@ async def async_setup_entry(
         if not coordinator.data:
             return
         new_entities = []
-        for zone in coordinator.data.get("zones", []):
+        for zone in coordinator.data.get("_wireless_zones", []):
             if zone.get("is_wireless"):
                 zone_index = zone.get("index", zone.get("id", 0))
-                uid = f"{zone.get('device_mac', '')}_zone_{zone_index}_battery"
-                if uid not in created_battery_sensors:
-                    created_battery_sensors.add(uid)
+                key = (zone.get("device_mac", ""), zone_index)
+                if key not in created_battery_sensors:
+                    created_battery_sensors.add(key)
                     new_entities.append(
                         GuardianZoneBatterySensor(
                             coordinator,
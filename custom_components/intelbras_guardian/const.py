@@ -11,6 +11,10 @@ CONF_DEVICE_PASSWORD = "device_password"
 # Default values
 DEFAULT_FASTAPI_PORT = 8000
 DEFAULT_SCAN_INTERVAL = 1
+# Upper bound for the adaptive (idle) poll interval. Kept short: zone and
+# arm-state changes are only seen by polling, SSE carries cloud events only
+MAX_SCAN_INTERVAL = 4
+IDLE_TICKS_BEFORE_BACKOFF = 3  # Unchanged polls before the interval starts growing
 
 # Eletrificador models
 ELETRIFICADOR_MODELS = ["ELC", "ELETRIFICADOR"]
@@ -1,9 +1,13 @@
 """Data update coordinator for Intelbras Guardian."""
 import asyncio
 import logging
+import random
+import re
 import time
 from datetime import timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
@@ -13,10 +17,22 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 from .api_client import GuardianApiClient
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, EVENT_ALARM
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    ELETRIFICADOR_MODELS,
+    EVENT_ALARM,
+    IDLE_TICKS_BEFORE_BACKOFF,
+    MAX_SCAN_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Single case-insensitive scan for any eletrificador model marker
+_ELETRIFICADOR_RE = re.compile(
+    "|".join(re.escape(m) for m in ELETRIFICADOR_MODELS), re.IGNORECASE
+)
+
 
 class GuardianCoordinator(DataUpdateCoordinator):
     """Coordinator for fetching data from Intelbras Guardian API."""
@@ -77,6 +93,10 @@ class GuardianCoordinator(DataUpdateCoordinator):
         self._connection_unavailable_since: Dict[int, float] = {}
         self._connection_unavailable_grace = 60  # seconds
 
+        # Static per-device metadata derived from the cloud device payload
+        # (model never changes), computed on first sighting.
+        self._device_meta_cache: Dict[int, Dict[str, Any]] = {}
+
         # Previous zone open states for edge detection (zone events)
         self._prev_zone_open: Dict[tuple, bool] = {}
 
@@ -90,6 +110,21 @@ class GuardianCoordinator(DataUpdateCoordinator):
         self._sse_task: Optional[asyncio.Task] = None
         self._sse_stop_event: Optional[asyncio.Event] = None
 
+        # Only one SSE-triggered refresh in flight: bursts of cloud events
+        # coalesce into the refresh that is already running.
+        self._refresh_sem = asyncio.Semaphore(1)
+
+        # Cap in-flight ISECNet status requests so large accounts do not
+        # open a burst of panel connections on every refresh cycle.
+        self._isecnet_sem = asyncio.Semaphore(8)
+
+        # Adaptive polling: while nothing changes the interval doubles (up to
+        # MAX_SCAN_INTERVAL); any state change or new event snaps it back.
+        self._base_interval = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+        self._max_interval = timedelta(seconds=MAX_SCAN_INTERVAL)
+        self._idle_ticks = 0
+        self._last_state_signature: Optional[int] = None
+
     async def start_sse_listener(self) -> None:
         """Start SSE listener for real-time events."""
         if self._sse_task is not None:
@@ -133,6 +168,9 @@ class GuardianCoordinator(DataUpdateCoordinator):
         # Fire a Home Assistant event for automations
         self.hass.bus.async_fire(EVENT_ALARM, event_data)
 
+        # Activity on the panel: go back to the fast poll cadence
+        self._reset_adaptive_interval()
+
         # If this is a state_changed event from our own command, apply immediately
         if event_data.get("event_type") == "state_changed":
             self._apply_state_change(event_data)
@@ -142,8 +180,15 @@ class GuardianCoordinator(DataUpdateCoordinator):
             if event_data.get("is_alarm") and self.data:
                 self._apply_alarm_trigger(event_data)
 
-            # External event (cloud) - trigger full refresh
-            self.hass.async_create_task(self.async_request_refresh())
+            # External event (cloud) - trigger full refresh, unless one
+            # is already in flight (it will pick up this event too)
+            if not self._refresh_sem.locked():
+                self.hass.async_create_task(self._bounded_refresh())
+
+    async def _bounded_refresh(self) -> None:
+        """Request a refresh, holding the semaphore so bursts coalesce."""
+        async with self._refresh_sem:
+            await self.async_request_refresh()
 
     def _apply_state_change(self, event_data: Dict[str, Any]) -> None:
         """Apply a state change from command directly to cached data."""
@@ -245,7 +290,7 @@ class GuardianCoordinator(DataUpdateCoordinator):
 
         # Update last_event so sensor.casa_last_event also updates immediately
         zone = event_data.get("zone")
-        self.data["last_event"] = {
+        last_event = {
             "id": event_data.get("id"),
             "timestamp": event_data.get("timestamp"),
             "event_type": event_data.get("event_name"),
@@ -257,12 +302,109 @@ class GuardianCoordinator(DataUpdateCoordinator):
             "partition_id": event_data.get("partition_id"),
             "device_id": device_id,
         }
+        self.data["last_event"] = last_event
+        # Only extend an existing per-device map: an empty one means events
+        # carry no device ids and sensors read the account-wide last event,
+        # so adding this device would blank every other device's sensor
+        by_device = self.data.get("last_event_by_device")
+        if by_device:
+            by_device[device_id] = last_event
 
         # Notify HA that data changed — entities will see triggered state
         self.async_set_updated_data(self.data)
 
+    def _get_device_meta(self, device: Dict[str, Any]) -> Dict[str, Any]:
+        """Return cached static metadata for a device, computing it once."""
+        device_id = device.get("id")
+        meta = self._device_meta_cache.get(device_id)
+        if meta is None:
+            model = device.get("model", "")
+            meta = {
+                "mac": device.get("mac", ""),
+                "model": model,
+                "is_eletrificador": bool(model and _ELETRIFICADOR_RE.search(model)),
+            }
+            self._device_meta_cache[device_id] = meta
+        return meta
+
+    @property
+    def eletrificador_device_ids(self) -> List[int]:
+        """Return ids of the current devices that are eletrificadores."""
+        devices = (self.data or {}).get("devices", {})
+        return [
+            device_id for device_id, meta in self._device_meta_cache.items()
+            if meta["is_eletrificador"] and device_id in devices
+        ]
+
+    def _reset_adaptive_interval(self) -> None:
+        """Return to the base poll interval."""
+        self._idle_ticks = 0
+        self.update_interval = self._base_interval
+
+    def _update_adaptive_interval(
+        self,
+        processed_devices: Dict[int, Dict[str, Any]],
+        all_zones: List[Dict[str, Any]],
+        has_new_events: bool,
+    ) -> None:
+        """Back off the poll interval while the panels report no changes."""
+        signature = hash((
+            tuple(
+                (device_id, d.get("arm_mode"), d.get("is_triggered"), d.get("connection_unavailable"))
+                for device_id, d in processed_devices.items()
+            ),
+            tuple(
+                (z.get("device_id"), z.get("index"), z.get("is_open"), z.get("is_bypassed"))
+                for z in all_zones
+            ),
+        ))
+        changed = signature != self._last_state_signature
+        self._last_state_signature = signature
+
+        if changed or has_new_events:
+            self._reset_adaptive_interval()
+            return
+
+        self._idle_ticks += 1
+        if self._idle_ticks >= IDLE_TICKS_BEFORE_BACKOFF:
+            exponent = min(self._idle_ticks - IDLE_TICKS_BEFORE_BACKOFF + 1, 2)
+            self.update_interval = min(self._base_interval * (2 ** exponent), self._max_interval)
+
+    async def _with_retry(
+        self,
+        request: Callable[[], Awaitable[Any]],
+        tries: int = 3,
+        base_delay: float = 0.3,
+    ) -> Any:
+        """Retry a cloud request on connection errors and timeouts.
+
+        Retries use exponential backoff with jitter; the last failure is
+        raised. Any result, including an empty one, is returned as-is.
+        """
+        for attempt in range(tries):
+            try:
+                return await request()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == tries - 1:
+                    raise
+            delay = base_delay * (2 ** attempt) + random.uniform(0, 0.1)
+            _LOGGER.debug("Transient API failure, retrying in %.2fs", delay)
+            await asyncio.sleep(delay)
+
+    async def _fetch_device_status(self, device_id: int) -> Optional[Dict[str, Any]]:
+        """Fetch real-time status for a device, bounded by the ISECNet semaphore."""
+        async with self._isecnet_sem:
+            return await self.client.get_alarm_status_auto(device_id)
+
     async def _async_update_data(self) -> Dict[str, Any]:
         """Fetch data from API."""
+        # No entity is subscribed (e.g. all disabled): keep the last snapshot
+        # instead of polling. The first refresh always runs because entities
+        # are only added after it. HA reschedules polling once a listener
+        # is added again.
+        if self.data is not None and not self._listeners:
+            return self.data
+
         try:
             # Check if we have a valid session
             if not self.client.session_id:
@@ -289,7 +431,7 @@ class GuardianCoordinator(DataUpdateCoordinator):
 
             if fetch_cloud:
                 self._cloud_api_counter = 0
-                devices = await self.client.get_devices()
+                devices = await self._with_retry(lambda: self.client.get_devices(raise_errors=True))
                 if not devices:
                     _LOGGER.warning("No devices found or session may be invalid")
                     await self.stop_sse_listener()
@@ -303,12 +445,9 @@ class GuardianCoordinator(DataUpdateCoordinator):
                         "needs_reauth": True,
                     }
                 self._cached_devices = devices
-                self._cached_events = await self.client.get_events(limit=20)
             else:
                 devices = self._cached_devices
 
-            events = self._cached_events or []
-
             # Start SSE listener if not already running (for real-time events)
             if self._sse_task is None:
                 await self.start_sse_listener()
@@ -318,6 +457,29 @@ class GuardianCoordinator(DataUpdateCoordinator):
             all_partitions = []
             all_zones = []
 
+            # Fetch real-time status for every device concurrently; results
+            # are merged serially below so shared state is only mutated in
+            # one place.
+            status_device_ids = [
+                device.get("id") for device in devices if device.get("has_saved_password")
+            ]
+            status_fetches = [self._fetch_device_status(device_id) for device_id in status_device_ids]
+            if fetch_cloud:
+                # Events are fetched in the same gather so the cloud round trip
+                # overlaps with the ISECNet status polls and never outlives
+                # this update.
+                *status_results, events_result = await asyncio.gather(
+                    *status_fetches,
+                    self.client.get_events(limit=20),
+                    return_exceptions=True,
+                )
+                if isinstance(events_result, BaseException):
+                    raise events_result
+                self._cached_events = events_result
+            else:
+                status_results = await asyncio.gather(*status_fetches, return_exceptions=True)
+            statuses = dict(zip(status_device_ids, status_results))
+
             for device in devices:
                 device_id = device.get("id")
                 processed_devices[device_id] = device
@@ -337,28 +499,36 @@ class GuardianCoordinator(DataUpdateCoordinator):
                     if isinstance(p_status, str):
                         prev_partition_statuses[p_idx] = p_status
 
+                # Device attributes reused throughout this iteration
+                device_meta = self._get_device_meta(device)
+                mac = device_meta["mac"]
+                model_str = device_meta["model"]
+                desc = device.get("description", "Alarme")
+                device_partitions = device.get("partitions", [])
+
                 # Check if device is eletrificador
-                model = device.get("model", "").upper()
-                is_eletrificador = "ELC" in model or "ELETRIFICADOR" in model
+                is_eletrificador = device_meta["is_eletrificador"]
 
                 # Try to get real-time status using auto-sync (uses saved password)
                 # This now also returns zones, eliminating need for separate /zones call
                 status_zones = []
                 if device.get("has_saved_password"):
                     try:
-                        status = await self.client.get_alarm_status_auto(device_id)
+                        status = statuses.get(device_id)
+                        if isinstance(status, BaseException):
+                            raise status
                         if status:
                             # Update device with real-time status
-                            processed_devices[device_id]["real_time_status"] = status
-                            processed_devices[device_id]["arm_mode"] = status.get("arm_mode")
-                            processed_devices[device_id]["is_armed"] = status.get("is_armed")
-                            processed_devices[device_id]["is_triggered"] = status.get("is_triggered")
+                            device["real_time_status"] = status
+                            device["arm_mode"] = status.get("arm_mode")
+                            device["is_armed"] = status.get("is_armed")
+                            device["is_triggered"] = status.get("is_triggered")
 
                             # Protect SSE-detected triggered state from being
                             # cleared by ISECNet polling before HA can react
                             if device_id in self._sse_triggered_until:
                                 if time.time() < self._sse_triggered_until[device_id]:
-                                    processed_devices[device_id]["is_triggered"] = True
+                                    device["is_triggered"] = True
                                 else:
                                     del self._sse_triggered_until[device_id]
 
@@ -377,40 +547,44 @@ class GuardianCoordinator(DataUpdateCoordinator):
                             else:
                                 self._connection_unavailable_since.pop(device_id, None)
                                 debounced_unavailable = False
-                            processed_devices[device_id]["connection_unavailable_raw"] = connection_unavailable_raw
-                            processed_devices[device_id]["connection_unavailable"] = debounced_unavailable
-                            processed_devices[device_id]["last_updated"] = status.get("last_updated")
+                            device["connection_unavailable_raw"] = connection_unavailable_raw
+                            device["connection_unavailable"] = debounced_unavailable
+                            device["last_updated"] = status.get("last_updated")
 
                             if connection_unavailable_raw:
                                 _LOGGER.debug(
-                                    f"Device {device_id} connection unavailable (raw, "
-                                    f"debounced={debounced_unavailable}) - using last known state. "
-                                    f"Message: {status.get('message')}"
+                                    "Device %s connection unavailable (raw, debounced=%s) - "
+                                    "using last known state. Message: %s",
+                                    device_id, debounced_unavailable, status.get("message"),
                                 )
 
                             # Eletrificador-specific fields
                             if is_eletrificador:
-                                processed_devices[device_id]["shock_enabled"] = status.get("shock_enabled")
-                                processed_devices[device_id]["alarm_enabled"] = status.get("alarm_enabled")
-                                processed_devices[device_id]["shock_triggered"] = status.get("shock_triggered")
-                                processed_devices[device_id]["alarm_triggered"] = status.get("alarm_triggered")
+                                device["shock_enabled"] = status.get("shock_enabled")
+                                device["alarm_enabled"] = status.get("alarm_enabled")
+                                device["shock_triggered"] = status.get("shock_triggered")
+                                device["alarm_triggered"] = status.get("alarm_triggered")
 
                             # Update partitions_enabled from real-time status
                             if "partitions_enabled" in status:
-                                processed_devices[device_id]["partitions_enabled"] = status.get("partitions_enabled")
+                                device["partitions_enabled"] = status.get("partitions_enabled")
 
                             # Update partition statuses from real-time data
                             # Note: ISECNet returns partitions with 'index' (0, 1, 2...)
                             # while cloud API returns partitions with large 'id' values
                             # We match by position in the list (index)
-                            if status.get("partitions"):
-                                device_partitions_list = device.get("partitions", [])
-                                for rt_partition in status.get("partitions", []):
+                            # (a direct list index, so the merge is O(P))
+                            rt_partitions = status.get("partitions")
+                            if rt_partitions:
+                                partition_count = len(device_partitions)
+                                for rt_partition in rt_partitions:
                                     rt_index = rt_partition.get("index", 0)
-                                    if rt_index < len(device_partitions_list):
-                                        device_partitions_list[rt_index]["status"] = rt_partition.get("state")
+                                    if rt_index < partition_count:
+                                        rt_state = rt_partition.get("state")
+                                        device_partitions[rt_index]["status"] = rt_state
                                         _LOGGER.debug(
-                                            f"Updated partition {rt_index} status to {rt_partition.get('state')}"
+                                            "Updated partition %s status to %s",
+                                            rt_index, rt_state,
                                         )
 
                             # Bug 3 preservation: AMT_2018_E_SMART zeros the
@@ -419,7 +593,7 @@ class GuardianCoordinator(DataUpdateCoordinator):
                             # the siren sounding. Snapshot the pre-trigger mode
                             # on the False->True transition and restore it from
                             # memory while the device stays triggered.
-                            if processed_devices[device_id].get("is_triggered"):
+                            if device.get("is_triggered"):
                                 if not prev_is_triggered:
                                     if device_id not in self._pre_trigger_arm_mode:
                                         if isinstance(prev_arm_mode, str) and prev_arm_mode.startswith("armed"):
@@ -433,31 +607,29 @@ class GuardianCoordinator(DataUpdateCoordinator):
                                             self._pre_trigger_partition_status[device_id] = armed_prev
 
                                 pre_mode = self._pre_trigger_arm_mode.get(device_id)
-                                if pre_mode and processed_devices[device_id].get("arm_mode") == "disarmed":
-                                    processed_devices[device_id]["arm_mode"] = pre_mode
-                                    processed_devices[device_id]["is_armed"] = True
+                                if pre_mode and device.get("arm_mode") == "disarmed":
+                                    device["arm_mode"] = pre_mode
+                                    device["is_armed"] = True
 
                                 snapshot = self._pre_trigger_partition_status.get(device_id, {})
                                 if snapshot:
-                                    partitions_to_restore = device.get("partitions", [])
                                     for idx, prev_status in snapshot.items():
-                                        if idx < len(partitions_to_restore):
-                                            current = partitions_to_restore[idx].get("status")
+                                        if idx < len(device_partitions):
+                                            current = device_partitions[idx].get("status")
                                             if (current is None or current == "disarmed") and \
                                                isinstance(prev_status, str) and prev_status.startswith("armed"):
-                                                partitions_to_restore[idx]["status"] = prev_status
+                                                device_partitions[idx]["status"] = prev_status
 
                             # Get zones from status (avoids separate ISECNet call)
                             if status.get("zones"):
                                 status_zones = status.get("zones", [])
                     except Exception as e:
-                        _LOGGER.debug(f"Could not get real-time status for device {device_id}: {e}")
+                        _LOGGER.debug("Could not get real-time status for device %s: %s", device_id, e)
 
                 # Extract partitions (only for non-eletrificadores)
                 # Trust the partitions returned by the API, unless partitions_enabled is explicitly False
                 if not is_eletrificador:
-                    partitions_enabled = processed_devices[device_id].get("partitions_enabled")
-                    device_partitions = device.get("partitions", [])
+                    partitions_enabled = device.get("partitions_enabled")
 
                     # Show multiple partitions if:
                     # - partitions_enabled is True (confirmed by ISECNet), OR
@@ -465,41 +637,43 @@ class GuardianCoordinator(DataUpdateCoordinator):
                     # Only collapse to single partition if partitions_enabled is explicitly False
                     if partitions_enabled is not False and len(device_partitions) > 1:
                         # Multiple partitions - add all
+                        device_partition_copies = []
                         for partition in device_partitions:
                             partition_copy = partition.copy()
                             partition_copy["device_id"] = device_id
-                            partition_copy["device_mac"] = device.get("mac", "")
-                            partition_copy["device_model"] = device.get("model", "")
-                            all_partitions.append(partition_copy)
+                            partition_copy["device_mac"] = mac
+                            partition_copy["device_model"] = model_str
+                            device_partition_copies.append(partition_copy)
+                        all_partitions.extend(device_partition_copies)
                     elif device_partitions:
                         # Single partition or partitions explicitly disabled
                         partition = device_partitions[0].copy()
                         partition["device_id"] = device_id
-                        partition["device_mac"] = device.get("mac", "")
-                        partition["device_model"] = device.get("model", "")
+                        partition["device_mac"] = mac
+                        partition["device_model"] = model_str
                         if partitions_enabled is False or len(device_partitions) == 1:
-                            partition["name"] = device.get("description", "Alarme")
+                            partition["name"] = desc
                         # Use device-level arm_mode
-                        partition["status"] = processed_devices[device_id].get("arm_mode")
+                        partition["status"] = device.get("arm_mode")
                         all_partitions.append(partition)
                     else:
                         # Create a virtual partition
                         all_partitions.append({
                             "id": 0,
                             "device_id": device_id,
-                            "device_mac": device.get("mac", ""),
-                            "device_model": device.get("model", ""),
-                            "name": device.get("description", "Alarme"),
-                            "status": processed_devices[device_id].get("arm_mode"),
+                            "device_mac": mac,
+                            "device_model": model_str,
+                            "name": desc,
+                            "status": device.get("arm_mode"),
                         })
 
                 # Get zones - prefer from status (already fetched), avoids extra ISECNet call
                 if status_zones:
                     # Use zones from real-time status
-                    for zone in status_zones:
-                        all_zones.append({
+                    all_zones.extend([
+                        {
                             "device_id": device_id,
-                            "device_mac": device.get("mac", ""),
+                            "device_mac": mac,
                             "index": zone.get("index", 0),
                             "name": zone.get("name", f"Zona {zone.get('index', 0) + 1:02d}"),
                             "is_open": zone.get("is_open", False),
@@ -509,25 +683,33 @@ class GuardianCoordinator(DataUpdateCoordinator):
                             "battery_low": zone.get("battery_low", False),
                             "signal_strength": zone.get("signal_strength"),
                             "tamper": zone.get("tamper", False),
-                        })
+                        }
+                        for zone in status_zones
+                    ])
                 else:
                     # Fallback: use zones from device data (cloud API)
                     device_zones = device.get("zones", [])
                     if device_zones:
                         # Try to calculate index from zone IDs (they are usually sequential)
                         # e.g., IDs 21135370, 21135371, ... correspond to indices 0, 1, ...
-                        zone_ids = [z.get("id", 0) for z in device_zones if z.get("id")]
-                        min_zone_id = min(zone_ids) if zone_ids else 0
+                        min_zone_id = 0
+                        for z in device_zones:
+                            zone_id = z.get("id")
+                            if zone_id and (not min_zone_id or zone_id < min_zone_id):
+                                min_zone_id = zone_id
 
                         for zone in device_zones:
-                            zone["device_id"] = device_id
-                            zone["device_mac"] = device.get("mac", "")
+                            # Cloud zone dicts are reused across ticks while
+                            # devices are cached; only tag them once
+                            if "device_mac" not in zone:
+                                zone["device_id"] = device_id
+                                zone["device_mac"] = mac
                             # Calculate index from ID (ID - min_ID = index)
                             if "index" not in zone and zone.get("id"):
                                 zone["index"] = zone.get("id") - min_zone_id
                             elif "index" not in zone:
                                 zone["index"] = 0
-                            all_zones.append(zone)
+                        all_zones.extend(device_zones)
 
             # Triggered safety timeout (Bug 2): only clears `is_triggered`
             # when the API has NOT confirmed it during the configured window.
@@ -615,23 +797,40 @@ class GuardianCoordinator(DataUpdateCoordinator):
                     self._pre_trigger_arm_mode.pop(device_id, None)
                     self._pre_trigger_partition_status.pop(device_id, None)
 
-            # Check for new events
+            events = self._cached_events or []
+
+            # Check for new events and track the newest id in a single pass
             new_events = []
-            if events and self._last_event_id is not None:
+            if events:
+                last_event_id = self._last_event_id
+                max_event_id = 0
                 for event in events:
-                    if event.get("id", 0) > self._last_event_id:
+                    event_id = event.get("id", 0)
+                    if last_event_id is not None and event_id > last_event_id:
                         new_events.append(event)
+                    if event_id > max_event_id:
+                        max_event_id = event_id
+                self._last_event_id = max_event_id
 
-            if events:
-                self._last_event_id = max(
-                    e.get("id", 0) for e in events
-                ) if events else None
+            # Newest event per device (events arrive newest-first)
+            last_event_by_device: Dict[int, Dict[str, Any]] = {}
+            for event in events:
+                event_device_id = event.get("device_id")
+                if event_device_id is not None and event_device_id not in last_event_by_device:
+                    last_event_by_device[event_device_id] = event
 
             # Build lookup indexes for O(1) access by entities
             zone_index = {}
+            zone_id_index = {}
+            wireless_zones = []
             for zone in all_zones:
                 key = (zone.get("device_id"), zone.get("index"))
                 zone_index[key] = zone
+                zone_id = zone.get("id")
+                if zone_id:
+                    zone_id_index[(zone.get("device_id"), zone_id)] = zone
+                if zone.get("is_wireless"):
+                    wireless_zones.append(zone)
             partition_index = {}
             for partition in all_partitions:
                 key = (partition.get("device_id"), partition.get("id"))
@@ -647,6 +846,8 @@ class GuardianCoordinator(DataUpdateCoordinator):
                     zone_triggered.append(key)
                 self._prev_zone_open[key] = is_open
 
+            self._update_adaptive_interval(processed_devices, all_zones, bool(new_events))
+
             return {
                 "devices": processed_devices,
                 "partitions": all_partitions,
@@ -654,13 +855,16 @@ class GuardianCoordinator(DataUpdateCoordinator):
                 "events": events,
                 "new_events": new_events,
                 "last_event": events[0] if events else None,
+                "last_event_by_device": last_event_by_device,
                 "_zone_index": zone_index,
+                "_zone_id_index": zone_id_index,
+                "_wireless_zones": wireless_zones,
                 "_partition_index": partition_index,
                 "_zone_triggered": zone_triggered,
             }
 
         except Exception as err:
-            _LOGGER.error(f"Error fetching data: {err}")
+            _LOGGER.error("Error fetching data: %s", err)
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
     async def async_refresh_device(self, device_id: int) -> None:
@@ -678,7 +882,7 @@ class GuardianCoordinator(DataUpdateCoordinator):
             return
 
         try:
-            status = await self.client.get_alarm_status_auto(device_id)
+            status = await self._fetch_device_status(device_id)
             if not status:
                 return
 
@@ -702,8 +906,7 @@ class GuardianCoordinator(DataUpdateCoordinator):
             device["last_updated"] = status.get("last_updated")
 
             # Eletrificador-specific fields
-            model = device.get("model", "").upper()
-            if "ELC" in model or "ELETRIFICADOR" in model:
+            if self._get_device_meta(device)["is_eletrificador"]:
                 device["shock_enabled"] = status.get("shock_enabled")
                 device["alarm_enabled"] = status.get("alarm_enabled")
                 device["shock_triggered"] = status.get("shock_triggered")
@@ -713,7 +916,7 @@ class GuardianCoordinator(DataUpdateCoordinator):
             self.async_set_updated_data(self.data)
 
         except Exception as e:
-            _LOGGER.debug(f"Could not refresh device {device_id}: {e}")
+            _LOGGER.debug("Could not refresh device %s: %s", device_id, e)
 
     def get_device(self, device_id: int) -> Optional[Dict[str, Any]]:
         """Get a specific device from cached data."""
@@ -729,8 +932,16 @@ class GuardianCoordinator(DataUpdateCoordinator):
         """Get a specific partition from cached data."""
         if self.data:
             index = self.data.get("_partition_index")
-            if index:
+            if index is not None:
                 return index.get((device_id, partition_id))
+            # Index not built (data not produced by a full refresh): scan
+            return next(
+                (
+                    item for item in self.data.get("partitions", [])
+                    if item.get("device_id") == device_id and item.get("id") == partition_id
+                ),
+                None,
+            )
         return None
 
     def get_zone(
@@ -741,8 +952,16 @@ class GuardianCoordinator(DataUpdateCoordinator):
         """Get a specific zone from cached data by index."""
         if self.data:
             index = self.data.get("_zone_index")
-            if index:
+            if index is not None:
                 return index.get((device_id, zone_index))
+            # Index not built (data not produced by a full refresh): scan
+            return next(
+                (
+                    item for item in self.data.get("zones", [])
+                    if item.get("device_id") == device_id and item.get("index") == zone_index
+                ),
+                None,
+            )
         return None
 
     def get_zone_by_id(
@@ -752,9 +971,15 @@ class GuardianCoordinator(DataUpdateCoordinator):
     ) -> Optional[Dict[str, Any]]:
         """Get a specific zone from cached data by ID."""
         if self.data:
-            # zone_by_id is less common, fall back to linear scan
-            for zone in self.data.get("zones", []):
-                if (zone.get("device_id") == device_id and
-                    zone.get("id") == zone_id):
-                    return zone
+            index = self.data.get("_zone_id_index")
+            if index is not None:
+                return index.get((device_id, zone_id))
+            # Index not built (data not produced by a full refresh): scan
+            return next(
+                (
+                    item for item in self.data.get("zones", [])
+                    if item.get("device_id") == device_id and item.get("id") == zone_id
+                ),
+                None,
+            )
         return None
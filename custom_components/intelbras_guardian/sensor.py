@@ -1,4 +1,10 @@
-"""Sensor platform for Intelbras Guardian events."""
+"""Sensor platform for Intelbras Guardian events.
+
+Performance notes: entity properties are read on every coordinator update
+(entities x updates per second), and their cost is Python attribute and
+dict lookups, not arithmetic. Optimizations here should reduce lookups
+(per-snapshot caching, local binding, memoized parsing), not vectorize.
+"""
 import logging
 from datetime import datetime
 from typing import Any, Optional
@@ -14,6 +20,13 @@ from .coordinator import GuardianCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only values for the "nothing to report" branches; also used
+# as the default for missing nested event fields. Never mutate these.
+_EMPTY: dict[str, Any] = {}
+_NO_EVENTS = "No events"
+
+_fromiso = datetime.fromisoformat
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -24,8 +37,9 @@ async def async_setup_entry(
     coordinator: GuardianCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     entities = []
-    # Track which wireless signal sensors have been created (by unique_id)
-    created_signal_sensors: set[str] = set()
+    # Track which wireless signal sensors have been created, keyed by
+    # (device_mac, zone_index) so the listener needs no string formatting
+    created_signal_sensors: set[tuple[str, int]] = set()
 
     # Add a last event sensor for each device
     if coordinator.data:
@@ -40,10 +54,9 @@ async def async_setup_entry(
             )
 
         # Add wireless signal sensor for each wireless zone already known
-        for zone in coordinator.data.get("zones", []):
+        for zone in coordinator.data.get("_wireless_zones", []):
             if zone.get("is_wireless"):
-                uid = f"{zone.get('device_mac', '')}_zone_{zone.get('index', 0)}_signal"
-                created_signal_sensors.add(uid)
+                created_signal_sensors.add((zone.get("device_mac", ""), zone.get("index", 0)))
                 entities.append(
                     GuardianWirelessSignalSensor(
                         coordinator,
@@ -61,11 +74,11 @@ async def async_setup_entry(
         if not coordinator.data:
             return
         new_entities = []
-        for zone in coordinator.data.get("zones", []):
+        for zone in coordinator.data.get("_wireless_zones", []):
             if zone.get("is_wireless"):
-                uid = f"{zone.get('device_mac', '')}_zone_{zone.get('index', 0)}_signal"
-                if uid not in created_signal_sensors:
-                    created_signal_sensors.add(uid)
+                key = (zone.get("device_mac", ""), zone.get("index", 0))
+                if key not in created_signal_sensors:
+                    created_signal_sensors.add(key)
                     new_entities.append(
                         GuardianWirelessSignalSensor(
                             coordinator,
@@ -104,70 +117,114 @@ class GuardianLastEventSensor(CoordinatorEntity, SensorEntity):
         # Entity attributes
         self._attr_unique_id = f"{device_mac}_last_event"
 
+        # Per-snapshot lookup cache (see `_device`)
+        self._cached_data: Optional[dict[str, Any]] = None
+        self._cached_device: Optional[dict[str, Any]] = None
+
+        # Device info is static for the entity's lifetime; build it once
+        device = coordinator.get_device(device_id)
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device_mac)},
+            "name": device.get("description", f"Intelbras Alarm {device_id}"),
+            "manufacturer": "Intelbras",
+            "model": device.get("model", "Guardian Alarm"),
+        } if device else None
+
+        # Last parsed timestamp: (raw_timestamp, parsed_timestamp)
+        self._ts_cache: tuple = (None, None)
+
+        # Attributes built for the last event: (event dict, attributes).
+        # Keyed on the event object itself because SSE triggers replace
+        # `last_event` with a new dict that may reuse a cloud event id.
+        self._attrs_cache: tuple = (None, {})
+
+    def _device(self) -> Optional[dict[str, Any]]:
+        """Return this entity's device, looked up once per coordinator snapshot."""
+        data = self.coordinator.data
+        if data is not self._cached_data:
+            self._cached_data = data
+            self._cached_device = self.coordinator.get_device(self._device_id)
+        return self._cached_device
+
     @property
     def available(self) -> bool:
         """Return True if entity is available (connection to panel is working)."""
         if not self.coordinator.last_update_success:
             return False
-        device = self.coordinator.get_device(self._device_id)
+        device = self._device()
         if device and device.get("connection_unavailable", False):
             return False
         return True
 
-    @property
-    def device_info(self):
-        """Return device info."""
-        device = self.coordinator.get_device(self._device_id)
-        if device:
-            return {
-                "identifiers": {(DOMAIN, self._device_mac)},
-                "name": device.get("description", f"Intelbras Alarm {self._device_id}"),
-                "manufacturer": "Intelbras",
-                "model": device.get("model", "Guardian Alarm"),
-            }
-        return None
+    def _get_last_event(self) -> Optional[dict[str, Any]]:
+        """Return the newest event for this device.
+
+        Falls back to the account-wide last event when the API does not
+        report device ids for events.
+        """
+        data = self.coordinator.data
+        if not data:
+            return None
+        by_device = data.get("last_event_by_device")
+        if by_device:
+            return by_device.get(self._device_id)
+        return data.get("last_event")
 
     @property
     def native_value(self) -> Optional[str]:
         """Return the state of the sensor."""
-        if self.coordinator.data:
-            last_event = self.coordinator.data.get("last_event")
-            if last_event:
-                notification = last_event.get("notification", {})
-                return notification.get("title", last_event.get("event_type", "Unknown"))
-        return "No events"
+        last_event = self._get_last_event()
+        if not last_event:
+            return _NO_EVENTS
+        try:
+            return last_event["notification"]["title"]
+        except (KeyError, TypeError):
+            return last_event.get("event_type", "Unknown")
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        if self.coordinator.data:
-            last_event = self.coordinator.data.get("last_event")
-            if last_event:
-                notification = last_event.get("notification", {})
-                zone = last_event.get("zone", {})
-
-                # Parse timestamp
-                timestamp = last_event.get("timestamp")
-                if timestamp and isinstance(timestamp, str):
-                    try:
-                        timestamp = datetime.fromisoformat(
-                            timestamp.replace("Z", "+00:00")
-                        ).isoformat()
-                    except ValueError:
-                        pass
-
-                return {
-                    "event_id": last_event.get("id"),
-                    "timestamp": timestamp,
-                    "event_type": last_event.get("event_type"),
-                    "title": notification.get("title"),
-                    "message": notification.get("message"),
-                    "zone_id": zone.get("id") if zone else None,
-                    "zone_name": zone.get("name") if zone else None,
-                    "partition_id": last_event.get("partition_id"),
-                    "device_id": last_event.get("device_id"),
-                }
-        return {}
+        last_event = self._get_last_event()
+        if not last_event:
+            return _EMPTY
+
+        cached_event, cached_attrs = self._attrs_cache
+        if cached_event is last_event:
+            return cached_attrs
+
+        get = last_event.get
+        notification = get("notification") or _EMPTY
+        zone = get("zone") or _EMPTY
+
+        # Parse timestamp (memoized on the raw string; the same string is
+        # normally reused across snapshots so the compare hits on identity)
+        event_id = get("id")
+        timestamp = get("timestamp")
+        if timestamp and isinstance(timestamp, str):
+            ts_raw, ts_parsed = self._ts_cache
+            if timestamp == ts_raw:
+                timestamp = ts_parsed
+            else:
+                raw_timestamp = timestamp
+                try:
+                    timestamp = _fromiso(timestamp.replace("Z", "+00:00")).isoformat()
+                except ValueError:
+                    pass
+                self._ts_cache = (raw_timestamp, timestamp)
+
+        attrs = {
+            "event_id": event_id,
+            "timestamp": timestamp,
+            "event_type": get("event_type"),
+            "title": notification.get("title"),
+            "message": notification.get("message"),
+            "zone_id": zone.get("id"),
+            "zone_name": zone.get("name"),
+            "partition_id": get("partition_id"),
+            "device_id": get("device_id"),
+        }
+        self._attrs_cache = (last_event, attrs)
+        return attrs
 
 
 class GuardianWirelessSignalSensor(CoordinatorEntity, SensorEntity):
@@ -192,13 +249,46 @@ class GuardianWirelessSignalSensor(CoordinatorEntity, SensorEntity):
         self._device_mac = device_mac
 
         self._attr_unique_id = f"{device_mac}_zone_{zone_index}_signal"
+        self._default_zone_name = f"Zona {zone_index + 1:02d}"
+
+        # Per-snapshot lookup cache (see `_refresh_lookups`)
+        self._cached_data: Optional[dict[str, Any]] = None
+        self._cached_device: Optional[dict[str, Any]] = None
+        self._cached_zone: Optional[dict[str, Any]] = None
+
+        # Device info is static for the entity's lifetime; build it once
+        device = coordinator.get_device(device_id)
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device_mac)},
+            "name": device.get("description", f"Intelbras Alarm {device_id}"),
+            "manufacturer": "Intelbras",
+            "model": device.get("model", "Guardian Alarm"),
+        } if device else None
+
+    def _refresh_lookups(self) -> None:
+        """Look up device and zone once per coordinator snapshot."""
+        data = self.coordinator.data
+        if data is not self._cached_data:
+            self._cached_data = data
+            self._cached_device = self.coordinator.get_device(self._device_id)
+            self._cached_zone = self.coordinator.get_zone(self._device_id, self._zone_index)
+
+    def _device(self) -> Optional[dict[str, Any]]:
+        """Return this entity's device for the current snapshot."""
+        self._refresh_lookups()
+        return self._cached_device
+
+    def _zone(self) -> Optional[dict[str, Any]]:
+        """Return this entity's zone for the current snapshot."""
+        self._refresh_lookups()
+        return self._cached_zone
 
     @property
     def available(self) -> bool:
         """Return True if entity is available (connection to panel is working)."""
         if not self.coordinator.last_update_success:
             return False
-        device = self.coordinator.get_device(self._device_id)
+        device = self._device()
         if device and device.get("connection_unavailable", False):
             return False
         return True
@@ -206,29 +296,16 @@ class GuardianWirelessSignalSensor(CoordinatorEntity, SensorEntity):
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        zone = self.coordinator.get_zone(self._device_id, self._zone_index)
-        zone_name = f"Zona {self._zone_index + 1:02d}"
+        zone = self._zone()
+        zone_name = self._default_zone_name
         if zone:
             zone_name = zone.get("name", zone_name)
         return f"{zone_name} Signal"
 
-    @property
-    def device_info(self):
-        """Return device info."""
-        device = self.coordinator.get_device(self._device_id)
-        if device:
-            return {
-                "identifiers": {(DOMAIN, self._device_mac)},
-                "name": device.get("description", f"Intelbras Alarm {self._device_id}"),
-                "manufacturer": "Intelbras",
-                "model": device.get("model", "Guardian Alarm"),
-            }
-        return None
-
     @property
     def native_value(self) -> Optional[int]:
         """Return the signal strength value (0-10)."""
-        zone = self.coordinator.get_zone(self._device_id, self._zone_index)
+        zone = self._zone()
         if zone:
             return zone.get("signal_strength")
         return None
@@ -236,7 +313,7 @@ class GuardianWirelessSignalSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        zone = self.coordinator.get_zone(self._device_id, self._zone_index)
+        zone = self._zone()
         if zone:
             return {
                 "zone_index": self._zone_index,
@@ -244,4 +321,4 @@ class GuardianWirelessSignalSensor(CoordinatorEntity, SensorEntity):
                 "battery_low": zone.get("battery_low", False),
                 "tamper": zone.get("tamper", False),
             }
-        return {}
+        return _EMPTY
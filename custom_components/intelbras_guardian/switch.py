@@ -1,26 +1,25 @@
-"""Switch platform for Intelbras Guardian eletrificadores."""
+"""Switch platform for Intelbras Guardian eletrificadores.
+
+Performance notes: the hot path is `_handle_coordinator_update`, which runs
+for every switch on every poll and is bound by dict lookups; see the
+per-snapshot `_device` cache and the skipped no-op state writes.
+"""
 import logging
-from typing import Any
+from typing import Any, Optional
 
 from homeassistant.components.switch import SwitchEntity, SwitchDeviceClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, ELETRIFICADOR_MODELS
+from .const import DOMAIN
 from .coordinator import GuardianCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-
-def is_eletrificador(device: dict) -> bool:
-    """Check if device is an electric fence (eletrificador)."""
-    model = device.get("model", "")
-    if not model:
-        return False
-    model_upper = model.upper()
-    return any(elc in model_upper for elc in ELETRIFICADOR_MODELS)
+# Shared read-only attributes for entities whose device is missing
+_EMPTY_ATTRS: dict[str, Any] = {}
 
 
 async def async_setup_entry(
@@ -33,8 +32,10 @@ async def async_setup_entry(
 
     entities = []
     if coordinator.data:
-        for device_id, device in coordinator.data.get("devices", {}).items():
-            if is_eletrificador(device):
+        # Eletrificadores are classified once by the coordinator
+        for device_id in coordinator.eletrificador_device_ids:
+            device = coordinator.get_device(device_id)
+            if device:
                 # Shock control switch
                 entities.append(
                     GuardianEletrificadorShockSwitch(
@@ -60,6 +61,8 @@ class GuardianEletrificadorShockSwitch(CoordinatorEntity, SwitchEntity):
 
     _attr_has_entity_name = True
     _attr_device_class = SwitchDeviceClass.SWITCH
+    _attr_name = "Choque"
+    _attr_icon = "mdi:flash"
 
     def __init__(
         self,
@@ -74,36 +77,45 @@ class GuardianEletrificadorShockSwitch(CoordinatorEntity, SwitchEntity):
 
         # Entity attributes
         self._attr_unique_id = f"{device_mac}_shock"
-        self._attr_name = "Choque"
-        self._attr_icon = "mdi:flash"
+
+        # Per-snapshot lookup cache (see `_device`)
+        self._cached_data: Optional[dict[str, Any]] = None
+        self._cached_device: Optional[dict[str, Any]] = None
+
+        # Last written (available, is_on, attributes) - skip no-op writes
+        self._last_state: Optional[tuple] = None
+
+        # Device info is static for the entity's lifetime; build it once
+        device = coordinator.get_device(device_id)
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device_mac)},
+            "name": device.get("description", f"Eletrificador {device_id}"),
+            "manufacturer": "Intelbras",
+            "model": device.get("model", "Eletrificador"),
+        } if device else None
+
+    def _device(self) -> Optional[dict[str, Any]]:
+        """Return this entity's device, looked up once per coordinator snapshot."""
+        data = self.coordinator.data
+        if data is not self._cached_data:
+            self._cached_data = data
+            self._cached_device = self.coordinator.get_device(self._device_id)
+        return self._cached_device
 
     @property
     def available(self) -> bool:
         """Return True if entity is available (connection to panel is working)."""
         if not self.coordinator.last_update_success:
             return False
-        device = self.coordinator.get_device(self._device_id)
+        device = self._device()
         if device and device.get("connection_unavailable", False):
             return False
         return True
 
-    @property
-    def device_info(self):
-        """Return device info."""
-        device = self.coordinator.get_device(self._device_id)
-        if device:
-            return {
-                "identifiers": {(DOMAIN, self._device_mac)},
-                "name": device.get("description", f"Eletrificador {self._device_id}"),
-                "manufacturer": "Intelbras",
-                "model": device.get("model", "Eletrificador"),
-            }
-        return None
-
     @property
     def is_on(self) -> bool:
         """Return true if shock is enabled."""
-        device = self.coordinator.get_device(self._device_id)
+        device = self._device()
         if not device:
             return False
         return device.get("shock_enabled", False)
@@ -111,13 +123,22 @@ class GuardianEletrificadorShockSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def extra_state_attributes(self):
         """Return extra state attributes."""
-        device = self.coordinator.get_device(self._device_id)
+        device = self._device()
         if device:
             return {
                 "device_id": self._device_id,
                 "shock_triggered": device.get("shock_triggered", False),
             }
-        return {}
+        return _EMPTY_ATTRS
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when something this switch exposes changed."""
+        # Compare exactly what the entity exposes to HA
+        state = (self.available, self.is_on, self.extra_state_attributes)
+        if state != self._last_state:
+            self._last_state = state
+            self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on shock."""
@@ -143,6 +164,8 @@ class GuardianEletrificadorAlarmSwitch(CoordinatorEntity, SwitchEntity):
 
     _attr_has_entity_name = True
     _attr_device_class = SwitchDeviceClass.SWITCH
+    _attr_name = "Alarme"
+    _attr_icon = "mdi:shield"
 
     def __init__(
         self,
@@ -157,36 +180,45 @@ class GuardianEletrificadorAlarmSwitch(CoordinatorEntity, SwitchEntity):
 
         # Entity attributes
         self._attr_unique_id = f"{device_mac}_alarm"
-        self._attr_name = "Alarme"
-        self._attr_icon = "mdi:shield"
+
+        # Per-snapshot lookup cache (see `_device`)
+        self._cached_data: Optional[dict[str, Any]] = None
+        self._cached_device: Optional[dict[str, Any]] = None
+
+        # Last written (available, is_on, attributes) - skip no-op writes
+        self._last_state: Optional[tuple] = None
+
+        # Device info is static for the entity's lifetime; build it once
+        device = coordinator.get_device(device_id)
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device_mac)},
+            "name": device.get("description", f"Eletrificador {device_id}"),
+            "manufacturer": "Intelbras",
+            "model": device.get("model", "Eletrificador"),
+        } if device else None
+
+    def _device(self) -> Optional[dict[str, Any]]:
+        """Return this entity's device, looked up once per coordinator snapshot."""
+        data = self.coordinator.data
+        if data is not self._cached_data:
+            self._cached_data = data
+            self._cached_device = self.coordinator.get_device(self._device_id)
+        return self._cached_device
 
     @property
     def available(self) -> bool:
         """Return True if entity is available (connection to panel is working)."""
         if not self.coordinator.last_update_success:
             return False
-        device = self.coordinator.get_device(self._device_id)
+        device = self._device()
         if device and device.get("connection_unavailable", False):
             return False
         return True
 
-    @property
-    def device_info(self):
-        """Return device info."""
-        device = self.coordinator.get_device(self._device_id)
-        if device:
-            return {
-                "identifiers": {(DOMAIN, self._device_mac)},
-                "name": device.get("description", f"Eletrificador {self._device_id}"),
-                "manufacturer": "Intelbras",
-                "model": device.get("model", "Eletrificador"),
-            }
-        return None
-
     @property
     def is_on(self) -> bool:
         """Return true if alarm is armed."""
-        device = self.coordinator.get_device(self._device_id)
+        device = self._device()
         if not device:
             return False
         return device.get("alarm_enabled", False)
@@ -194,13 +226,22 @@ class GuardianEletrificadorAlarmSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def extra_state_attributes(self):
         """Return extra state attributes."""
-        device = self.coordinator.get_device(self._device_id)
+        device = self._device()
         if device:
             return {
                 "device_id": self._device_id,
                 "alarm_triggered": device.get("alarm_triggered", False),
             }
-        return {}
+        return _EMPTY_ATTRS
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when something this switch exposes changed."""
+        # Compare exactly what the entity exposes to HA
+        state = (self.available, self.is_on, self.extra_state_attributes)
+        if state != self._last_state:
+            self._last_state = state
+            self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Arm the alarm."""
@@ -11,8 +11,5 @@ from app.api.v1.zones import router as zones_router
 api_router = APIRouter(prefix="/api/v1")
 
 # Include all routers
-api_router.include_router(auth_router)
-api_router.include_router(devices_router)
-api_router.include_router(alarm_router)
-api_router.include_router(events_router)
-api_router.include_router(zones_router)
+for router in (auth_router, devices_router, alarm_router, events_router, zones_router):
+    api_router.include_router(router)
@@ -1,15 +1,22 @@
 """Alarm control endpoints using ISECNet Protocol."""
 import asyncio
+import functools
 import logging
-from dataclasses import dataclass
-from fastapi import APIRouter, HTTPException, Header
+import orjson
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from fastapi import APIRouter, HTTPException, Header, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
 from enum import Enum
 
 from app.services.auth_service import auth_service
 from app.services.guardian_client import guardian_client
 from app.services.isecnet_client import isecnet_client
+from app.services.isecnet_protocol import AlarmStatus
 from app.services.state_manager import state_manager
 from app.services.event_stream import event_stream
 from app.core.exceptions import (
@@ -23,6 +30,70 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/alarm", tags=["Alarm Control"])
 
+# Strong references to fire-and-forget tasks (the event loop only keeps weak ones)
+_background_tasks: Set["asyncio.Task[Any]"] = set()
+
+# In-flight ISECNet status calls per (device, password) (single-flight
+# coalescing); callers with a different password never share a result
+_inflight_status: Dict[Tuple[int, str], "asyncio.Future[Tuple[bool, AlarmStatus, str]]"] = {}
+
+# Status stream: how often a feed re-polls the panel when no state change is
+# reported in the meantime
+_STATUS_STREAM_INTERVAL = 2.0
+
+# Status stream: idle time before an SSE keep-alive comment is sent
+_STATUS_STREAM_PING = 15.0
+
+# Last formatted "last_updated" timestamp as (epoch second, ISO string)
+_utc_iso_cache: Tuple[int, str] = (0, "")
+
+# Siren-off is skipped when a last known status at most this old shows no alarm
+_SIREN_OFF_MAX_STATUS_AGE = timedelta(seconds=5)
+
+# Panic type -> display name used in logs and responses
+_PANIC_NAMES = {0: "silencioso", 1: "audível", 2: "incêndio", 3: "médico"}
+
+# Failure message classifiers (central busy/offline vs. open zones)
+# ("connect" also covers "connection" and "not connected")
+_CONN_ERR_RE = re.compile(r"busy|offline|timeout|connect", re.IGNORECASE)
+_OPEN_ZONES_RE = re.compile(r"open zones", re.IGNORECASE)
+
+# Arm modes that count as armed when verifying an arm command
+_ARMED_MODES = frozenset({"armed_away", "armed_stay"})
+
+# Unconfirmed arm: longest wait for the panel before the verify status read
+_ARM_VERIFY_DELAY = 0.5
+
+# Default zone labels ("Zona 01".."Zona 64"), built once instead of per zone
+_MAX_ZONES = 64
+_ZONE_NAMES = tuple(f"Zona {i + 1:02d}" for i in range(_MAX_ZONES))
+
+
+# ZoneStatusInfo defaults, for cached zones missing fields
+_ZONE_DEFAULTS: Dict[str, Any] = {
+    "is_open": False,
+    "is_bypassed": False,
+    "is_wireless": False,
+    "battery_low": False,
+    "signal_strength": None,
+    "tamper": False,
+    "is_in_alarm": False,
+}
+
+
+def _zone_name(index: int) -> str:
+    """Default display name for a 0-based zone index."""
+    if 0 <= index < _MAX_ZONES:
+        return _ZONE_NAMES[index]
+    return f"Zona {index + 1:02d}"
+
+
+# Short-lived memo of in-flight/finished device lookups (device ID -> raw
+# cloud record), keyed by access token. Connection info and partition index
+# are resolved concurrently for the same command, so they share one fetch.
+_DEVICE_RECORD_TTL = 5.0
+_devices_by_id_cache: Dict[str, Tuple[float, "asyncio.Future[Dict[int, Dict[str, Any]]]"]] = {}
+
 
 class ArmMode(str, Enum):
     """Arm mode options."""
@@ -122,7 +193,7 @@ class GetStatusRequest(BaseModel):
     save_password: bool = Field(default=False, description="Save password for future use")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeviceConnectionInfo:
     """Device connection information."""
     mac: str
@@ -130,9 +201,119 @@ class DeviceConnectionInfo:
     ip_receiver_addr: Optional[str] = None
     ip_receiver_port: Optional[int] = None
     ip_receiver_account: Optional[str] = None
+    # From ISECNet status (cached by auto-sync), None if not known yet
+    partitions_enabled: Optional[bool] = None
+    # IP receiver keyword arguments for isecnet_client calls, built once
+    ipr_kwargs: Dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "ipr_kwargs", {
+            "use_ip_receiver": self.use_ip_receiver,
+            "ip_receiver_addr": self.ip_receiver_addr,
+            "ip_receiver_port": self.ip_receiver_port,
+            "ip_receiver_account": self.ip_receiver_account,
+        })
+
+
+# Domain exception -> HTTP status for alarm command endpoints
+_EXC_STATUS = {
+    InvalidSessionError: 401,
+    AlarmOperationError: 400,
+    DeviceNotFoundError: 404,
+    APIConnectionError: 503,
+}
+_EXC_TYPES = tuple(_EXC_STATUS)
+
+
+def _alarm_endpoint(action: str) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Map domain exceptions raised by an endpoint to HTTPException.
+
+    HTTPExceptions (e.g. OpenZonesError) are re-raised as-is; anything
+    unexpected is logged and returned as 500.
+    """
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await fn(*args, **kwargs)
+            except HTTPException:
+                raise
+            except _EXC_TYPES as e:
+                status_code = next(_EXC_STATUS[t] for t in type(e).__mro__ if t in _EXC_STATUS)
+                raise HTTPException(status_code=status_code, detail=str(e.message))
+            except Exception as e:
+                logger.exception("Unexpected error %s", action)
+                raise HTTPException(status_code=500, detail=str(e))
+        return wrapper
+    return decorator
+
+
+def _run_in_background(coro: Awaitable[Any], description: str) -> None:
+    """Run a side effect without blocking the response, logging failures."""
+    task = asyncio.ensure_future(coro)
+    _background_tasks.add(task)
+
+    def _done(t: "asyncio.Task[Any]") -> None:
+        _background_tasks.discard(t)
+        if not t.cancelled() and t.exception() is not None:
+            logger.error("Background %s failed: %s", description, t.exception())
+
+    task.add_done_callback(_done)
+
+
+def _siren_known_off(device_id: int, last_known: Optional[Dict[str, Any]]) -> bool:
+    """Whether a recent last known status shows the alarm not triggered.
+
+    A snapshot older than an alarm event seen for the device never counts,
+    since the panel may have been triggered after it was taken.
+    """
+    if not last_known or last_known.get("is_triggered", True):
+        return False
+    last_updated = last_known.get("_last_updated")
+    if not last_updated:
+        return False
+    updated_at = datetime.fromisoformat(last_updated)
+    last_alarm = state_manager.get_last_alarm_event(device_id)
+    if last_alarm is not None and last_alarm >= updated_at:
+        return False
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return now - updated_at <= _SIREN_OFF_MAX_STATUS_AGE
+
+
+async def _await_armed_state(device_id: int, timeout: float) -> None:
+    """Wait up to timeout seconds for the device to be reported armed.
+
+    State changes that don't leave the last known status armed (e.g. an
+    unrelated event) keep waiting for the rest of the timeout.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    remaining = timeout
+    while remaining > 0:
+        if not await state_manager.await_state_change(device_id, remaining):
+            return
+        last_known = await state_manager.get_last_known_status(device_id)
+        if last_known and last_known.get("arm_mode") in _ARMED_MODES:
+            return
+        remaining = deadline - loop.time()
+
+
+async def _publish_state_change(device_id: int, partition_id: Optional[int], new_status: str) -> None:
+    """Drop the cached device state and broadcast the new status over SSE."""
+    # Clear device cache to force refresh
+    await state_manager.delete_device_state(device_id)
 
+    # Broadcast SSE event for instant HA state update
+    await event_stream.broadcast_event({
+        "event_type": "state_changed",
+        "device_id": device_id,
+        "partition_id": partition_id,
+        "new_status": new_status,
+        "source": "command",
+    }, event_type="alarm_event")
 
-async def _get_password(session_id: str, device_id: int, request_password: Optional[str], save_password: bool = False) -> Optional[str]:
+
+async def _get_password(session_id: str, device_id: int, request_password: Optional[str]) -> Optional[str]:
     """Get password from request or saved storage."""
     password = request_password
 
@@ -142,12 +323,38 @@ async def _get_password(session_id: str, device_id: int, request_password: Optio
         if password:
             logger.debug(f"Using saved password for device {device_id}")
 
-    # Save password if requested and provided
-    if save_password and request_password:
-        await state_manager.set_device_password(session_id, str(device_id), request_password)
+    return password
+
+
+async def _save_password(session_id: str, device_id: int, request: Any) -> None:
+    """Save the request password if asked to (call only once the session is valid)."""
+    if request.save_password and request.password:
+        await state_manager.set_device_password(session_id, str(device_id), request.password)
         logger.info(f"Saved password for device {device_id}")
 
-    return password
+
+async def _get_device_record(access_token: str, device_id: int) -> Optional[Dict[str, Any]]:
+    """Get the raw cloud record for a device, sharing one fetch per command.
+
+    Concurrent callers with the same access token await the same lookup; the
+    result is reused for a few seconds, then refetched.
+    """
+    now = time.monotonic()
+    entry = _devices_by_id_cache.get(access_token)
+    if entry is None or now - entry[0] > _DEVICE_RECORD_TTL:
+        # Drop stale entries so the memo doesn't grow with old tokens
+        for stale_key in [k for k, (ts, _) in _devices_by_id_cache.items() if now - ts > _DEVICE_RECORD_TTL]:
+            del _devices_by_id_cache[stale_key]
+        entry = (now, asyncio.ensure_future(guardian_client.get_alarm_centrals_by_id(access_token)))
+        _devices_by_id_cache[access_token] = entry
+    try:
+        devices_by_id = await asyncio.shield(entry[1])
+    except Exception:
+        # Don't memoize failures
+        if _devices_by_id_cache.get(access_token) is entry:
+            del _devices_by_id_cache[access_token]
+        raise
+    return devices_by_id.get(device_id)
 
 
 async def _get_device_connection_info(access_token: str, device_id: int, use_cache: bool = True) -> Optional[DeviceConnectionInfo]:
@@ -166,69 +373,77 @@ async def _get_device_connection_info(access_token: str, device_id: int, use_cac
         cached = await state_manager.get_device_conn_info(device_id)
         if cached:
             logger.debug(f"Using cached connection info for device {device_id}")
-            return DeviceConnectionInfo(
-                mac=cached.get("mac"),
-                use_ip_receiver=cached.get("use_ip_receiver", False),
-                ip_receiver_addr=cached.get("ip_receiver_addr"),
-                ip_receiver_port=cached.get("ip_receiver_port"),
-                ip_receiver_account=cached.get("ip_receiver_account")
-            )
+            return DeviceConnectionInfo(**cached)
 
     # Fetch from cloud API
     try:
-        raw_devices = await guardian_client.get_alarm_centrals(access_token)
-        for device in raw_devices:
-            if device.get("id") == device_id:
-                mac = device.get("central_mac") or device.get("mac")
-                if not mac:
-                    return None
-
-                # Check connection type
-                connections = device.get("connections") or {}
-                is_cloud = connections.get("is_cloud_enabled", False)
-                is_ip_receiver = connections.get("is_ip_receiver_server_enabled", False)
-
-                conn_info = None
-                if is_cloud:
-                    # Use cloud relay
-                    conn_info = DeviceConnectionInfo(mac=mac, use_ip_receiver=False)
-                elif is_ip_receiver:
-                    # Use IP receiver
-                    conn_info = DeviceConnectionInfo(
-                        mac=mac,
-                        use_ip_receiver=True,
-                        ip_receiver_addr=device.get("ip_receiver_server_addr"),
-                        ip_receiver_port=int(device.get("ip_receiver_server_port", 9009)),
-                        ip_receiver_account=device.get("ip_receiver_server_account")
-                    )
-                else:
-                    # Neither enabled - try cloud as fallback
-                    logger.warning(f"Device {device_id} has no cloud or IP receiver enabled, trying cloud")
-                    conn_info = DeviceConnectionInfo(mac=mac, use_ip_receiver=False)
-
-                # Cache the connection info for future use
-                if conn_info:
-                    await state_manager.set_device_conn_info(device_id, {
-                        "mac": conn_info.mac,
-                        "use_ip_receiver": conn_info.use_ip_receiver,
-                        "ip_receiver_addr": conn_info.ip_receiver_addr,
-                        "ip_receiver_port": conn_info.ip_receiver_port,
-                        "ip_receiver_account": conn_info.ip_receiver_account
-                    })
-                    logger.debug(f"Cached connection info for device {device_id}")
-
-                return conn_info
+        device = await _get_device_record(access_token, device_id)
+        if device is not None:
+            mac = device.get("central_mac") or device.get("mac")
+            if not mac:
+                return None
+
+            # Check connection type
+            connections = device.get("connections") or {}
+            is_cloud = connections.get("is_cloud_enabled", False)
+            is_ip_receiver = connections.get("is_ip_receiver_server_enabled", False)
+
+            if is_cloud:
+                # Use cloud relay
+                conn = {"mac": mac, "use_ip_receiver": False}
+            elif is_ip_receiver:
+                # Use IP receiver
+                conn = {
+                    "mac": mac,
+                    "use_ip_receiver": True,
+                    "ip_receiver_addr": device.get("ip_receiver_server_addr"),
+                    "ip_receiver_port": int(device.get("ip_receiver_server_port", 9009)),
+                    "ip_receiver_account": device.get("ip_receiver_server_account"),
+                }
+            else:
+                # Neither enabled - try cloud as fallback
+                logger.warning(f"Device {device_id} has no cloud or IP receiver enabled, trying cloud")
+                conn = {"mac": mac, "use_ip_receiver": False}
+
+            # Cache the connection info for future use
+            await state_manager.set_device_conn_info(device_id, conn)
+            logger.debug(f"Cached connection info for device {device_id}")
+
+            # Not part of the cloud record - comes from the last ISECNet status
+            partitions_enabled = await state_manager.get_device_partitions_enabled(device_id)
+            return DeviceConnectionInfo(**conn, partitions_enabled=partitions_enabled)
 
     except Exception as e:
         logger.error(f"Error getting device connection info: {e}")
     return None
 
 
+def _open_zones_payload(zones: List[Dict[str, Any]], friendly_names: Dict[int, str]) -> List[Dict[str, Any]]:
+    """Build the open-zones error payload (OpenZoneInfo shape) in a single pass."""
+    return [
+        {"index": i, "name": _zone_name(i), "friendly_name": friendly_names.get(i)}
+        for z in zones
+        if z.get("open", False) and (i := z["index"]) is not None
+    ]
+
+
+def _open_zones_http_exc(open_zones: List[Dict[str, Any]]) -> HTTPException:
+    """Build the 400 OpenZonesError response for a failed arm."""
+    return HTTPException(
+        status_code=400,
+        detail={
+            "error": "OpenZonesError",
+            "message": "Não é possível armar: existem zonas abertas",
+            "open_zones": open_zones
+        }
+    )
+
+
 async def _get_open_zones(
     device_id: int,
     conn_info: DeviceConnectionInfo,
     password: str
-) -> List[OpenZoneInfo]:
+) -> List[Dict[str, Any]]:
     """Get list of open zones for a device.
 
     This is called when arm fails with "Open zones" error to show which zones are open.
@@ -239,36 +454,25 @@ async def _get_open_zones(
         password: Device password
 
     Returns:
-        List of open zones with their friendly names
+        List of open zones (OpenZoneInfo-shaped dicts) with their friendly names
     """
     open_zones = []
     try:
-        # Get zone friendly names from storage
-        friendly_names = await state_manager.get_all_zone_friendly_names(device_id)
-
-        # Get status to find open zones
-        success, status, message = await isecnet_client.get_status(
-            device_id=device_id,
-            mac=conn_info.mac,
-            password=password,
-            use_ip_receiver=conn_info.use_ip_receiver,
-            ip_receiver_addr=conn_info.ip_receiver_addr,
-            ip_receiver_port=conn_info.ip_receiver_port,
-            ip_receiver_account=conn_info.ip_receiver_account
+        # Get status to find open zones on the pooled connection the failed
+        # command used (idle cleanup is left to the client's keep-alive loop).
+        # Zone friendly names come from storage and are fetched alongside.
+        friendly_names, (success, status, message) = await asyncio.gather(
+            state_manager.get_all_zone_friendly_names(device_id),
+            isecnet_client.get_status(
+                device_id=device_id,
+                mac=conn_info.mac,
+                password=password,
+                **conn_info.ipr_kwargs
+            )
         )
 
-        # Disconnect after getting status
-        await isecnet_client.disconnect(device_id)
-
         if success and status.zones:
-            for zone in status.zones:
-                if zone.get("open", False):
-                    zone_index = zone["index"]
-                    open_zones.append(OpenZoneInfo(
-                        index=zone_index,
-                        name=f"Zona {zone_index + 1:02d}",
-                        friendly_name=friendly_names.get(zone_index)
-                    ))
+            open_zones = _open_zones_payload(status.zones, friendly_names)
 
         logger.debug(f"Found {len(open_zones)} open zones for device {device_id}")
 
@@ -298,35 +502,120 @@ async def _get_partition_index(access_token: str, device_id: int, partition_id:
         0-based partition index if device has >1 partitions, or None if device
         has <=1 partitions (to skip partition byte in protocol)
     """
+    # Partition layout only changes with device topology, so a cached
+    # mapping avoids the cloud round trip on most arm/disarm commands
+    found, cached_index = await state_manager.get_partition_index(device_id, partition_id)
+    if found:
+        return cached_index
+
     try:
-        raw_devices = await guardian_client.get_alarm_centrals(access_token)
-        for device in raw_devices:
-            if device.get("id") == device_id:
-                partitions = device.get("partitions") or []
-
-                # If device has only 1 partition or no partitions, return None
-                # This tells the protocol to NOT include partition byte
-                # (devices without partitions enabled return error 0xE3)
-                if len(partitions) <= 1:
-                    logger.debug(f"Device {device_id} has {len(partitions)} partition(s), skipping partition byte")
-                    return None
-
-                # Device has multiple partitions - find the index
-                for idx, partition in enumerate(partitions):
-                    if partition.get("id") == partition_id:
-                        logger.debug(f"Partition ID {partition_id} -> index {idx}")
-                        return idx
-                # If partition_id is small (1, 2, 3), treat it as index directly
-                if partition_id <= len(partitions):
-                    logger.debug(f"Partition ID {partition_id} treated as 1-based index -> {partition_id - 1}")
-                    return partition_id - 1
-                break
+        device = await _get_device_record(access_token, device_id)
+        if device is not None:
+            partitions = device.get("partitions") or []
+
+            # If device has only 1 partition or no partitions, return None
+            # This tells the protocol to NOT include partition byte
+            # (devices without partitions enabled return error 0xE3)
+            if len(partitions) <= 1:
+                logger.debug(f"Device {device_id} has {len(partitions)} partition(s), skipping partition byte")
+                await state_manager.set_partition_index(device_id, partition_id, None)
+                return None
+
+            # Device has multiple partitions - find the index
+            for idx, partition in enumerate(partitions):
+                if partition.get("id") == partition_id:
+                    logger.debug(f"Partition ID {partition_id} -> index {idx}")
+                    await state_manager.set_partition_index(device_id, partition_id, idx)
+                    return idx
+            # If partition_id is small (1, 2, 3), treat it as index directly
+            if partition_id <= len(partitions):
+                logger.debug(f"Partition ID {partition_id} treated as 1-based index -> {partition_id - 1}")
+                await state_manager.set_partition_index(device_id, partition_id, partition_id - 1)
+                return partition_id - 1
     except Exception as e:
         logger.error(f"Error getting partition index: {e}")
     return None
 
 
+async def _run_isecnet_op(
+    x_session_id: str,
+    device_id: int,
+    request: Any,
+    op: str,
+    log_action: str,
+    failure: str,
+    check_connection: bool = False,
+    invalidate_state: bool = True,
+    **op_kwargs: Any
+) -> str:
+    """Run a single ISECNet command for an endpoint.
+
+    Resolves token, password and connection info, calls
+    `isecnet_client.<op>` and maps a failed result to the endpoint errors.
+
+    Args:
+        x_session_id: Session ID from the request header
+        device_id: Device ID
+        request: Request model with password/save_password
+        op: isecnet_client method name
+        log_action: Log prefix, followed by the device ID
+        failure: AlarmOperationError message prefix on failure
+        check_connection: Report connection errors as 503 ConnectionUnavailable
+        invalidate_state: Clear cached device state on success
+        **op_kwargs: Extra arguments for the isecnet_client method
+
+    Returns:
+        Message from the ISECNet client
+    """
+    # Token validation and password lookup are independent - run them together
+    access_token, password = await asyncio.gather(
+        auth_service.get_valid_token(x_session_id),
+        _get_password(x_session_id, device_id, request.password),
+    )
+    await _save_password(x_session_id, device_id, request)
+    if not password:
+        raise AlarmOperationError("Password required. Provide password or save one first.")
+
+    # Get device connection info from cloud API
+    conn_info = await _get_device_connection_info(access_token, device_id)
+    if not conn_info:
+        raise DeviceNotFoundError(f"Device {device_id} not found or connection info not available")
+
+    conn_type = "IP Receiver" if conn_info.use_ip_receiver else "Cloud"
+    logger.info(f"{log_action} {device_id} (MAC: {conn_info.mac}) via {conn_type}")
+
+    success, message = await getattr(isecnet_client, op)(
+        device_id=device_id,
+        mac=conn_info.mac,
+        password=password,
+        **conn_info.ipr_kwargs,
+        **op_kwargs
+    )
+
+    if not success:
+        # Connection blocked - likely AMT legacy app or network issue
+        if check_connection and _CONN_ERR_RE.search(message):
+            raise HTTPException(
+                status_code=503,
+                detail={
+                    "error": "ConnectionUnavailable",
+                    "message": f"Conexao com a central indisponivel: {message}. Verifique se o app AMT nao esta aberto.",
+                }
+            )
+        raise AlarmOperationError(f"{failure}: {message}")
+
+    if invalidate_state:
+        # Clear device cache to force refresh
+        _run_in_background(
+            state_manager.delete_device_state(device_id),
+            f"state invalidation for device {device_id}",
+        )
+
+    return message
+
+
 @router.post("/{device_id}/arm", response_model=AlarmOperationResponse)
+@_alarm_endpoint("arming")
 async def arm_partition(
     device_id: int,
     request: ArmRequest,
@@ -346,200 +635,138 @@ async def arm_partition(
 
     Requires X-Session-ID header from login.
     """
-    try:
-        # Get valid token to fetch device info
-        access_token = await auth_service.get_valid_token(x_session_id)
-
-        # Get password (from request or saved)
-        password = await _get_password(x_session_id, device_id, request.password, request.save_password)
-        if not password:
-            raise AlarmOperationError("Password required. Provide password or save one first.")
-
-        # Get device connection info from cloud API
-        conn_info = await _get_device_connection_info(access_token, device_id)
-        if not conn_info:
-            raise DeviceNotFoundError(f"Device {device_id} not found or connection info not available")
-
-        # Convert partition_id (API ID) to index (0-based) for protocol
-        # Note: _get_partition_index returns None for single-partition devices
-        # to indicate partition byte should be skipped (avoids 0xE3 error)
-        partition_index = None
-        if request.partition_id is not None:
-            partition_index = await _get_partition_index(access_token, device_id, request.partition_id)
-            # Don't fall back to index 0 - None is intentional for single-partition devices
-
-        conn_type = "IP Receiver" if conn_info.use_ip_receiver else "Cloud"
-
-        # Get cached partitions_enabled to know whether to include partition byte
-        # This is set by auto-sync when getting status
-        cached_partitions_enabled = await state_manager.get_device_partitions_enabled(device_id)
-        logger.info(f"Arming device {device_id} (MAC: {conn_info.mac}) via {conn_type} partition_index={partition_index} mode={request.mode} partitions_enabled={cached_partitions_enabled}")
-
-        # Arm using ISECNet protocol
-        success, message = await isecnet_client.arm(
-            device_id=device_id,
-            mac=conn_info.mac,
-            password=password,
-            mode=request.mode.value,
-            partition_index=partition_index,
-            use_ip_receiver=conn_info.use_ip_receiver,
-            ip_receiver_addr=conn_info.ip_receiver_addr,
-            ip_receiver_port=conn_info.ip_receiver_port,
-            ip_receiver_account=conn_info.ip_receiver_account,
-            partitions_enabled=cached_partitions_enabled
-        )
-
-        # If command was sent but not confirmed (no response from panel),
-        # verify status to check if arm actually succeeded
-        if success and "command sent" in message:
-            logger.info("ARM command sent without confirmation, verifying with status check...")
-            # Small delay to allow panel to process the command
-            await asyncio.sleep(0.5)
+    # Get valid token to fetch device info
+    access_token = await auth_service.get_valid_token(x_session_id)
+    await _save_password(x_session_id, device_id, request)
+
+    # Password, connection info and the partition index are independent
+    # once the token is known - fetch them concurrently instead of paying
+    # one round trip each.
+    # Note: _get_partition_index returns None for single-partition devices
+    # to indicate partition byte should be skipped (avoids 0xE3 error)
+    lookups = [
+        _get_password(x_session_id, device_id, request.password),
+        _get_device_connection_info(access_token, device_id),
+    ]
+    if request.partition_id is not None:
+        lookups.append(_get_partition_index(access_token, device_id, request.partition_id))
+    password, conn_info, *rest = await asyncio.gather(*lookups)
+    # Don't fall back to index 0 - None is intentional for single-partition devices
+    partition_index = rest[0] if rest else None
 
-            # Check status to verify
-            verify_success, status, verify_msg = await isecnet_client.get_status(
+    if not password:
+        raise AlarmOperationError("Password required. Provide password or save one first.")
+    if not conn_info:
+        raise DeviceNotFoundError(f"Device {device_id} not found or connection info not available")
+
+    conn_type = "IP Receiver" if conn_info.use_ip_receiver else "Cloud"
+
+    # Cached partitions_enabled (set by auto-sync when getting status)
+    # tells whether to include partition byte
+    cached_partitions_enabled = conn_info.partitions_enabled
+    logger.info(f"Arming device {device_id} (MAC: {conn_info.mac}) via {conn_type} partition_index={partition_index} mode={request.mode} partitions_enabled={cached_partitions_enabled}")
+
+    # Arm using ISECNet protocol
+    success, message = await isecnet_client.arm(
+        device_id=device_id,
+        mac=conn_info.mac,
+        password=password,
+        mode=request.mode.value,
+        partition_index=partition_index,
+        **conn_info.ipr_kwargs,
+        partitions_enabled=cached_partitions_enabled
+    )
+
+    # If command was sent but not confirmed (no response from panel),
+    # verify status to check if arm actually succeeded
+    if success and "command sent" in message:
+        logger.info("ARM command sent without confirmation, verifying with status check...")
+        # Give the panel up to 0.5s to process the command, returning early
+        # only if the device is reported armed in the meantime
+        await _await_armed_state(device_id, _ARM_VERIFY_DELAY)
+
+        # Check status to verify on the pooled connection the arm command used
+        # (zone friendly names are fetched alongside for the open-zones error)
+        friendly_names, (verify_success, status, verify_msg) = await asyncio.gather(
+            state_manager.get_all_zone_friendly_names(device_id),
+            isecnet_client.get_status(
                 device_id=device_id,
                 mac=conn_info.mac,
                 password=password,
-                use_ip_receiver=conn_info.use_ip_receiver,
-                ip_receiver_addr=conn_info.ip_receiver_addr,
-                ip_receiver_port=conn_info.ip_receiver_port,
-                ip_receiver_account=conn_info.ip_receiver_account
+                **conn_info.ipr_kwargs
             )
+        )
 
-            # Disconnect after status check
-            await isecnet_client.disconnect(device_id)
-
-            if verify_success:
-                expected_mode = "armed_away" if request.mode == ArmMode.AWAY else "armed_stay"
-                # Check if the panel is now armed (or arming)
-                if status.is_armed or status.arm_mode in ["armed_away", "armed_stay"]:
-                    logger.info(f"ARM verified: status shows {status.arm_mode}")
-                    success = True
-                    message = f"Armed ({request.mode.value})"
-                elif status.arm_mode == "disarmed":
-                    # Panel is still disarmed - ARM likely failed due to open zones
-                    # Check for open zones - we already have them from status
-                    open_zones_list = [z for z in status.zones if z.get("open", False)]
-                    if open_zones_list:
-                        logger.warning(f"ARM failed - panel still disarmed, {len(open_zones_list)} open zones detected")
-                        # Get friendly names for the zones we found
-                        friendly_names = await state_manager.get_all_zone_friendly_names(device_id)
-                        open_zones = [
-                            OpenZoneInfo(
-                                index=z["index"],
-                                name=f"Zona {z['index'] + 1:02d}",
-                                friendly_name=friendly_names.get(z["index"])
-                            )
-                            for z in open_zones_list
-                        ]
-                        # Return error response directly with open zones
-                        raise HTTPException(
-                            status_code=400,
-                            detail={
-                                "error": "OpenZonesError",
-                                "message": "Não é possível armar: existem zonas abertas",
-                                "open_zones": [
-                                    {
-                                        "index": z.index,
-                                        "name": z.name,
-                                        "friendly_name": z.friendly_name
-                                    }
-                                    for z in open_zones
-                                ]
-                            }
-                        )
-                    else:
-                        # No open zones but still disarmed - command may not have been received
-                        logger.warning("ARM failed - panel still disarmed, no open zones detected")
-                        success = False
-                        message = "Arm command not accepted by panel"
-            else:
-                # Could not verify - assume command was sent and let UI sync handle the rest
-                logger.warning(f"Could not verify ARM status: {verify_msg}")
-                # Keep success=True since command was sent
-
-        if not success:
-            # Check if this is a connection error (central busy, offline, etc.)
-            connection_errors = ["busy", "offline", "timeout", "connection", "not connected", "connect"]
-            is_connection_error = any(err in message.lower() for err in connection_errors)
-
-            if is_connection_error:
-                # Connection blocked - likely AMT legacy app or network issue
-                raise HTTPException(
-                    status_code=503,
-                    detail={
-                        "error": "ConnectionUnavailable",
-                        "message": f"Conexao com a central indisponivel: {message}. Verifique se o app AMT nao esta aberto.",
-                    }
-                )
-
-            # Check if this is an "Open zones" error - if so, fetch which zones are open
-            if "Open zones" in message or "open zones" in message.lower():
-                open_zones = await _get_open_zones(
-                    device_id=device_id,
-                    conn_info=conn_info,
-                    password=password
-                )
-
-                # Return error response with open zones info
-                raise HTTPException(
-                    status_code=400,
-                    detail={
-                        "error": "OpenZonesError",
-                        "message": "Não é possível armar: existem zonas abertas",
-                        "open_zones": [
-                            {
-                                "index": z.index,
-                                "name": z.name,
-                                "friendly_name": z.friendly_name
-                            }
-                            for z in open_zones
-                        ]
-                    }
-                )
-            raise AlarmOperationError(f"Failed to arm: {message}")
+        if verify_success:
+            # Check if the panel is now armed (or arming)
+            if status.is_armed or status.arm_mode in _ARMED_MODES:
+                logger.info(f"ARM verified: status shows {status.arm_mode}")
+                success = True
+                message = f"Armed ({request.mode.value})"
+            elif status.arm_mode == "disarmed":
+                # Panel is still disarmed - ARM likely failed due to open zones
+                # Check for open zones - we already have them from status
+                open_zones = _open_zones_payload(status.zones, friendly_names)
+                if open_zones:
+                    logger.warning(f"ARM failed - panel still disarmed, {len(open_zones)} open zones detected")
+                    # Return error response directly with open zones
+                    raise _open_zones_http_exc(open_zones)
+                else:
+                    # No open zones but still disarmed - command may not have been received
+                    logger.warning("ARM failed - panel still disarmed, no open zones detected")
+                    success = False
+                    message = "Arm command not accepted by panel"
+        else:
+            # Could not verify - assume command was sent and let UI sync handle the rest
+            logger.warning(f"Could not verify ARM status: {verify_msg}")
+            # Keep success=True since command was sent
+
+    if not success:
+        # Check if this is a connection error (central busy, offline, etc.)
+        is_connection_error = _CONN_ERR_RE.search(message) is not None
+
+        if is_connection_error:
+            # Connection blocked - likely AMT legacy app or network issue
+            raise HTTPException(
+                status_code=503,
+                detail={
+                    "error": "ConnectionUnavailable",
+                    "message": f"Conexao com a central indisponivel: {message}. Verifique se o app AMT nao esta aberto.",
+                }
+            )
 
-        # Clear device cache to force refresh
-        await state_manager.delete_device_state(device_id)
+        # Check if this is an "Open zones" error - if so, fetch which zones are open
+        if _OPEN_ZONES_RE.search(message):
+            open_zones = await _get_open_zones(
+                device_id=device_id,
+                conn_info=conn_info,
+                password=password
+            )
 
-        # Determine new status based on mode
-        new_status = "armed_away" if request.mode == ArmMode.AWAY else "armed_stay"
+            # Return error response with open zones info
+            raise _open_zones_http_exc(open_zones)
+        raise AlarmOperationError(f"Failed to arm: {message}")
 
-        # Broadcast SSE event for instant HA state update
-        await event_stream.broadcast_event({
-            "event_type": "state_changed",
-            "device_id": device_id,
-            "partition_id": request.partition_id,
-            "new_status": new_status,
-            "source": "command",
-        }, event_type="alarm_event")
+    # Determine new status based on mode
+    new_status = "armed_away" if request.mode == ArmMode.AWAY else "armed_stay"
 
-        return AlarmOperationResponse(
-            success=True,
-            device_id=device_id,
-            partition_id=request.partition_id,
-            new_status=new_status,
-            message=f"Armed in {request.mode.value} mode"
-        )
+    # Cache invalidation and SSE broadcast don't need to delay the reply
+    _run_in_background(
+        _publish_state_change(device_id, request.partition_id, new_status),
+        f"state change publish for device {device_id}"
+    )
 
-    except HTTPException:
-        # Re-raise HTTPExceptions (including OpenZonesError) as-is
-        raise
-    except InvalidSessionError as e:
-        raise HTTPException(status_code=401, detail=str(e.message))
-    except AlarmOperationError as e:
-        raise HTTPException(status_code=400, detail=str(e.message))
-    except DeviceNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e.message))
-    except APIConnectionError as e:
-        raise HTTPException(status_code=503, detail=str(e.message))
-    except Exception as e:
-        logger.error(f"Unexpected error arming: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return AlarmOperationResponse(
+        success=True,
+        device_id=device_id,
+        partition_id=request.partition_id,
+        new_status=new_status,
+        message=f"Armed in {request.mode.value} mode"
+    )
 
 
 @router.post("/{device_id}/disarm", response_model=AlarmOperationResponse)
+@_alarm_endpoint("disarming")
 async def disarm_partition(
     device_id: int,
     request: DisarmRequest,
@@ -559,102 +786,80 @@ async def disarm_partition(
 
     Requires X-Session-ID header from login.
     """
-    try:
-        # Get valid token to fetch device info
-        access_token = await auth_service.get_valid_token(x_session_id)
-
-        # Get password (from request or saved)
-        password = await _get_password(x_session_id, device_id, request.password, request.save_password)
-        if not password:
-            raise AlarmOperationError("Password required. Provide password or save one first.")
-
-        # Get device connection info from cloud API
-        conn_info = await _get_device_connection_info(access_token, device_id)
-        if not conn_info:
-            raise DeviceNotFoundError(f"Device {device_id} not found or connection info not available")
-
-        # Convert partition_id (API ID) to index (0-based) for protocol
-        # Note: _get_partition_index returns None for single-partition devices
-        # to indicate partition byte should be skipped (avoids 0xE3 error)
-        partition_index = None
-        if request.partition_id is not None:
-            partition_index = await _get_partition_index(access_token, device_id, request.partition_id)
-            # Don't fall back to index 0 - None is intentional for single-partition devices
-
-        conn_type = "IP Receiver" if conn_info.use_ip_receiver else "Cloud"
-
-        # Get cached partitions_enabled to know whether to include partition byte
-        # This is set by auto-sync when getting status
-        cached_partitions_enabled = await state_manager.get_device_partitions_enabled(device_id)
-        logger.info(f"Disarming device {device_id} (MAC: {conn_info.mac}) via {conn_type} partition_index={partition_index} partitions_enabled={cached_partitions_enabled}")
-
-        # Disarm using ISECNet protocol
-        success, message = await isecnet_client.disarm(
-            device_id=device_id,
-            mac=conn_info.mac,
-            password=password,
-            partition_index=partition_index,
-            use_ip_receiver=conn_info.use_ip_receiver,
-            ip_receiver_addr=conn_info.ip_receiver_addr,
-            ip_receiver_port=conn_info.ip_receiver_port,
-            ip_receiver_account=conn_info.ip_receiver_account,
-            partitions_enabled=cached_partitions_enabled
-        )
-
-        if not success:
-            # Check if this is a connection error (central busy, offline, etc.)
-            connection_errors = ["busy", "offline", "timeout", "connection", "not connected", "connect"]
-            is_connection_error = any(err in message.lower() for err in connection_errors)
+    # Get valid token to fetch device info
+    access_token = await auth_service.get_valid_token(x_session_id)
+    await _save_password(x_session_id, device_id, request)
+
+    # Password, connection info and the partition index are independent
+    # once the token is known - fetch them concurrently instead of paying
+    # one round trip each.
+    # Note: _get_partition_index returns None for single-partition devices
+    # to indicate partition byte should be skipped (avoids 0xE3 error)
+    lookups = [
+        _get_password(x_session_id, device_id, request.password),
+        _get_device_connection_info(access_token, device_id),
+    ]
+    if request.partition_id is not None:
+        lookups.append(_get_partition_index(access_token, device_id, request.partition_id))
+    password, conn_info, *rest = await asyncio.gather(*lookups)
+    # Don't fall back to index 0 - None is intentional for single-partition devices
+    partition_index = rest[0] if rest else None
 
-            if is_connection_error:
-                # Connection blocked - likely AMT legacy app or network issue
-                raise HTTPException(
-                    status_code=503,
-                    detail={
-                        "error": "ConnectionUnavailable",
-                        "message": f"Conexao com a central indisponivel: {message}. Verifique se o app AMT nao esta aberto.",
-                    }
-                )
-
-            raise AlarmOperationError(f"Failed to disarm: {message}")
-
-        # Clear device cache to force refresh
-        await state_manager.delete_device_state(device_id)
+    if not password:
+        raise AlarmOperationError("Password required. Provide password or save one first.")
+    if not conn_info:
+        raise DeviceNotFoundError(f"Device {device_id} not found or connection info not available")
+
+    conn_type = "IP Receiver" if conn_info.use_ip_receiver else "Cloud"
+
+    # Cached partitions_enabled (set by auto-sync when getting status)
+    # tells whether to include partition byte
+    cached_partitions_enabled = conn_info.partitions_enabled
+    logger.info(f"Disarming device {device_id} (MAC: {conn_info.mac}) via {conn_type} partition_index={partition_index} partitions_enabled={cached_partitions_enabled}")
+
+    # Disarm using ISECNet protocol
+    success, message = await isecnet_client.disarm(
+        device_id=device_id,
+        mac=conn_info.mac,
+        password=password,
+        partition_index=partition_index,
+        **conn_info.ipr_kwargs,
+        partitions_enabled=cached_partitions_enabled
+    )
+
+    if not success:
+        # Check if this is a connection error (central busy, offline, etc.)
+        is_connection_error = _CONN_ERR_RE.search(message) is not None
+
+        if is_connection_error:
+            # Connection blocked - likely AMT legacy app or network issue
+            raise HTTPException(
+                status_code=503,
+                detail={
+                    "error": "ConnectionUnavailable",
+                    "message": f"Conexao com a central indisponivel: {message}. Verifique se o app AMT nao esta aberto.",
+                }
+            )
 
-        # Broadcast SSE event for instant HA state update
-        await event_stream.broadcast_event({
-            "event_type": "state_changed",
-            "device_id": device_id,
-            "partition_id": request.partition_id,
-            "new_status": "disarmed",
-            "source": "command",
-        }, event_type="alarm_event")
+        raise AlarmOperationError(f"Failed to disarm: {message}")
 
-        return AlarmOperationResponse(
-            success=True,
-            device_id=device_id,
-            partition_id=request.partition_id,
-            new_status="disarmed",
-            message="Disarmed successfully"
-        )
+    # Cache invalidation and SSE broadcast don't need to delay the reply
+    _run_in_background(
+        _publish_state_change(device_id, request.partition_id, "disarmed"),
+        f"state change publish for device {device_id}"
+    )
 
-    except HTTPException:
-        # Re-raise HTTPExceptions as-is
-        raise
-    except InvalidSessionError as e:
-        raise HTTPException(status_code=401, detail=str(e.message))
-    except AlarmOperationError as e:
-        raise HTTPException(status_code=400, detail=str(e.message))
-    except DeviceNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e.message))
-    except APIConnectionError as e:
-        raise HTTPException(status_code=503, detail=str(e.message))
-    except Exception as e:
-        logger.error(f"Unexpected error disarming: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return AlarmOperationResponse(
+        success=True,
+        device_id=device_id,
+        partition_id=request.partition_id,
+        new_status="disarmed",
+        message="Disarmed successfully"
+    )
 
 
 @router.post("/{device_id}/bypass-zone", response_model=AlarmOperationResponse)
+@_alarm_endpoint("bypassing zones")
 async def bypass_zones(
     device_id: int,
     request: BypassZoneRequest,
@@ -672,75 +877,248 @@ async def bypass_zones(
 
     Requires X-Session-ID header from login.
     """
-    try:
-        access_token = await auth_service.get_valid_token(x_session_id)
-
-        password = await _get_password(x_session_id, device_id, request.password, request.save_password)
-        if not password:
-            raise AlarmOperationError("Password required. Provide password or save one first.")
+    action = "Bypassing" if request.bypass else "Unbypassing"
+    message = await _run_isecnet_op(
+        x_session_id, device_id, request,
+        op="bypass_zones",
+        log_action=f"{action} zones {request.zone_indices} on device",
+        failure="Bypass failed",
+        check_connection=True,
+        zone_indices=request.zone_indices,
+        bypass=request.bypass
+    )
+
+    return AlarmOperationResponse(
+        success=True,
+        device_id=device_id,
+        partition_id=None,
+        new_status=None,
+        message=message
+    )
+
+
+def _partition_status_dicts(partitions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Convert protocol partitions to the PartitionStatusInfo shape."""
+    return [{"index": p["index"], "state": p["state"]} for p in partitions]
+
+
+def _zone_status_dicts(zones: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Convert protocol zones to the ZoneStatusInfo shape.
+
+    Plain dicts can be persisted as last known status as-is and turned into
+    models with model_construct (no re-validation of trusted protocol data).
+    """
+    return [
+        {
+            "index": z["index"],
+            "name": _zone_name(z["index"]),
+            "is_open": z.get("open", False),
+            "is_bypassed": z.get("bypassed", False),
+            "is_wireless": z.get("is_wireless", False),
+            "battery_low": z.get("battery_low", False),
+            "signal_strength": z.get("signal"),
+            "tamper": z.get("tamper", False),
+            "is_in_alarm": z.get("triggered", False),
+        }
+        for z in zones
+    ]
 
-        conn_info = await _get_device_connection_info(access_token, device_id)
-        if not conn_info:
-            raise DeviceNotFoundError(f"Device {device_id} not found or connection info not available")
 
-        conn_type = "IP Receiver" if conn_info.use_ip_receiver else "Cloud"
-        action = "Bypassing" if request.bypass else "Unbypassing"
-        logger.info(f"{action} zones {request.zone_indices} on device {device_id} (MAC: {conn_info.mac}) via {conn_type}")
+async def _get_status_coalesced(
+    device_id: int,
+    conn_info: DeviceConnectionInfo,
+    password: str
+) -> Tuple[bool, AlarmStatus, str]:
+    """Get ISECNet status, sharing one in-flight request per device.
 
-        success, message = await isecnet_client.bypass_zones(
+    Concurrent status requests for the same panel and password await the
+    same call instead of queueing one ISECNet round trip each behind the
+    device lock.
+    """
+    key = (device_id, password)
+    fut = _inflight_status.get(key)
+    if fut is None:
+        fut = asyncio.ensure_future(isecnet_client.get_status(
             device_id=device_id,
             mac=conn_info.mac,
             password=password,
-            zone_indices=request.zone_indices,
-            bypass=request.bypass,
-            use_ip_receiver=conn_info.use_ip_receiver,
-            ip_receiver_addr=conn_info.ip_receiver_addr,
-            ip_receiver_port=conn_info.ip_receiver_port,
-            ip_receiver_account=conn_info.ip_receiver_account
-        )
+            **conn_info.ipr_kwargs
+        ))
+        _inflight_status[key] = fut
+        fut.add_done_callback(lambda _: _inflight_status.pop(key, None))
+    # Shield so one cancelled caller doesn't cancel the call for the others
+    return await asyncio.shield(fut)
 
-        if not success:
-            connection_errors = ["busy", "offline", "timeout", "connection", "not connected", "connect"]
-            is_connection_error = any(err in message.lower() for err in connection_errors)
 
-            if is_connection_error:
-                raise HTTPException(
-                    status_code=503,
-                    detail={
-                        "error": "ConnectionUnavailable",
-                        "message": f"Conexao com a central indisponivel: {message}. Verifique se o app AMT nao esta aberto.",
-                    }
-                )
+def _last_known_response(
+    device_id: int,
+    last_known: Dict[str, Any],
+    message: str,
+    connection_unavailable: bool
+) -> Dict[str, Any]:
+    """Build a status response from a last known status snapshot."""
+    # Cached data is stored in the response shape already, so skip the
+    # pydantic models and serve the dicts as-is.
+    # Older snapshots may lack zone fields; fill the model defaults.
+    return {
+        "device_id": device_id,
+        "model": last_known.get("model"),
+        "mac": last_known.get("mac"),
+        "is_armed": last_known.get("is_armed", False),
+        "arm_mode": last_known.get("arm_mode", "disarmed"),
+        "is_triggered": last_known.get("is_triggered", False),
+        "partitions": last_known.get("partitions", []),
+        "partitions_enabled": last_known.get("partitions_enabled", False),
+        "zones": [
+            {**_ZONE_DEFAULTS, "name": _zone_name(z["index"]), **z}
+            for z in last_known.get("zones", [])
+        ],
+        "message": message,
+        # Eletrificador-specific fields
+        "is_eletrificador": last_known.get("is_eletrificador", False),
+        "shock_enabled": last_known.get("shock_enabled", False),
+        "shock_triggered": last_known.get("shock_triggered", False),
+        "alarm_enabled": last_known.get("alarm_enabled", False),
+        "alarm_triggered": last_known.get("alarm_triggered", False),
+        # Connection status
+        "connection_unavailable": connection_unavailable,
+        "last_updated": last_known.get("_last_updated"),
+    }
+
+
+async def _fetch_status(
+    x_session_id: str,
+    device_id: int,
+    password_lookup: Awaitable[Optional[str]],
+    *,
+    auto_sync: bool,
+    request: Optional[Any] = None
+) -> Union[AlarmStatusResponse, Dict[str, Any]]:
+    """Fetch real-time status from the panel and build the status response.
 
-            raise AlarmOperationError(f"Bypass failed: {message}")
+    Shared by the status and auto-sync endpoints.
 
-        # Clear device cache to force refresh
-        await state_manager.delete_device_state(device_id)
+    Args:
+        x_session_id: Session ID from the request header
+        device_id: Alarm central ID
+        password_lookup: Awaitable resolving the device password
+        auto_sync: Save each live status as last known status and fall back
+            to it when the panel is unreachable
+        request: Request model with password/save_password, saved once the
+            session is validated
 
-        return AlarmOperationResponse(
-            success=True,
-            device_id=device_id,
-            partition_id=None,
-            new_status=None,
-            message=message
-        )
+    Returns:
+        AlarmStatusResponse for a live status, or (auto-sync only) the last
+        known status as a plain response-shaped dict
+    """
+    # Token validation and password lookup are independent - run them together
+    access_token, password = await asyncio.gather(
+        auth_service.get_valid_token(x_session_id),
+        password_lookup,
+    )
+    if request is not None:
+        await _save_password(x_session_id, device_id, request)
+    if not password:
+        if auto_sync:
+            raise AlarmOperationError("No saved password for this device. Save a password first.")
+        raise AlarmOperationError("Password required. Provide password or save one first.")
 
-    except HTTPException:
-        raise
-    except InvalidSessionError as e:
-        raise HTTPException(status_code=401, detail=str(e.message))
-    except AlarmOperationError as e:
-        raise HTTPException(status_code=400, detail=str(e.message))
-    except DeviceNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e.message))
-    except APIConnectionError as e:
-        raise HTTPException(status_code=503, detail=str(e.message))
-    except Exception as e:
-        logger.error(f"Unexpected error bypassing zones: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # Get device connection info from cloud API
+    conn_info = await _get_device_connection_info(access_token, device_id)
+    if not conn_info:
+        raise DeviceNotFoundError(f"Device {device_id} not found or connection info not available")
+
+    conn_type = "IP Receiver" if conn_info.use_ip_receiver else "Cloud"
+    logger.info(f"{'Auto-sync status' if auto_sync else 'Getting status'} for device {device_id} (MAC: {conn_info.mac}) via {conn_type}")
+
+    # Get status using ISECNet protocol
+    success, status, message = await _get_status_coalesced(device_id, conn_info, password)
+
+    # Keep connection alive for fast subsequent polls.
+    # The ISECNet client's keep-alive loop handles idle cleanup (5 min timeout).
+    # Only disconnect on failure (handled below).
+
+    if not success:
+        if not auto_sync:
+            raise APIConnectionError(f"Failed to get status: {message}")
+
+        # Auto-sync: try to return last known status instead
+        logger.warning(f"Failed to get real-time status for device {device_id}: {message}")
+
+        # Try to get last known status from persistent cache
+        last_known = await state_manager.get_last_known_status(device_id)
+        if last_known:
+            logger.info(f"Returning last known status for device {device_id} (from {last_known.get('_last_updated')})")
+
+            return _last_known_response(
+                device_id, last_known,
+                f"Conexao indisponivel - usando ultimo estado conhecido. Erro: {message}",
+                connection_unavailable=True,
+            )
+        else:
+            # No cached status available - raise error
+            raise APIConnectionError(f"Failed to get status: {message}")
+
+    # Cache partitions_enabled for arm/disarm commands
+    # This is crucial because after disconnect, the protocol instance is destroyed
+    # and we need this info to know whether to include partition byte in commands.
+    # Persistence side effects don't need to delay the response.
+    _run_in_background(
+        state_manager.set_device_partitions_enabled(device_id, status.partitions_enabled),
+        f"partitions_enabled cache for device {device_id}",
+    )
+    logger.debug(f"Cached partitions_enabled={status.partitions_enabled} for device {device_id}")
+
+    # Convert partitions and zones to response format
+    partitions = _partition_status_dicts(status.partitions)
+    zones = _zone_status_dicts(status.zones)
+
+    if auto_sync:
+        # Save last known status for future connection failures
+        last_known_data = {
+            "model": status.model,
+            "mac": conn_info.mac,
+            "is_armed": status.is_armed,
+            "arm_mode": status.arm_mode,
+            "is_triggered": status.is_triggered,
+            "partitions": partitions,
+            "partitions_enabled": status.partitions_enabled,
+            "zones": zones,
+            "is_eletrificador": status.is_eletrificador,
+            "shock_enabled": status.shock_enabled,
+            "shock_triggered": status.shock_triggered,
+            "alarm_enabled": status.alarm_enabled,
+            "alarm_triggered": status.alarm_triggered,
+        }
+        # Awaited so the snapshot ETag matches the response being returned
+        await state_manager.set_last_known_status(device_id, last_known_data)
+
+    # Built from our own protocol output - skip validation
+    return AlarmStatusResponse.model_construct(
+        device_id=device_id,
+        model=status.model,
+        mac=conn_info.mac,
+        is_armed=status.is_armed,
+        arm_mode=status.arm_mode,
+        is_triggered=status.is_triggered,
+        partitions=[PartitionStatusInfo.model_construct(**p) for p in partitions],
+        partitions_enabled=status.partitions_enabled,
+        zones=[ZoneStatusInfo.model_construct(**z) for z in zones],
+        message="Auto-sync status retrieved successfully" if auto_sync else "Status retrieved successfully",
+        # Eletrificador-specific fields
+        is_eletrificador=status.is_eletrificador,
+        shock_enabled=status.shock_enabled,
+        shock_triggered=status.shock_triggered,
+        alarm_enabled=status.alarm_enabled,
+        alarm_triggered=status.alarm_triggered,
+        # Connection status
+        connection_unavailable=False,
+        last_updated=_utc_iso_now() if auto_sync else None
+    )
 
 
 @router.post("/{device_id}/status", response_model=AlarmStatusResponse)
+@_alarm_endpoint("getting status")
 async def get_alarm_status(
     device_id: int,
     request: GetStatusRequest,
@@ -757,98 +1135,52 @@ async def get_alarm_status(
 
     Requires X-Session-ID header from login.
     """
-    try:
-        # Get valid token to fetch device info
-        access_token = await auth_service.get_valid_token(x_session_id)
-
-        # Get password (from request or saved)
-        password = await _get_password(x_session_id, device_id, request.password, request.save_password)
-        if not password:
-            raise AlarmOperationError("Password required. Provide password or save one first.")
+    return await _fetch_status(
+        x_session_id, device_id,
+        _get_password(x_session_id, device_id, request.password),
+        auto_sync=False,
+        request=request
+    )
 
-        # Get device connection info from cloud API
-        conn_info = await _get_device_connection_info(access_token, device_id)
-        if not conn_info:
-            raise DeviceNotFoundError(f"Device {device_id} not found or connection info not available")
 
-        conn_type = "IP Receiver" if conn_info.use_ip_receiver else "Cloud"
-        logger.info(f"Getting status for device {device_id} (MAC: {conn_info.mac}) via {conn_type}")
+async def _get_auto_status(device_id: int, x_session_id: str) -> Union[AlarmStatusResponse, Dict[str, Any]]:
+    """Fetch auto-sync status with the saved password (last known status on failure)."""
+    return await _fetch_status(
+        x_session_id, device_id,
+        state_manager.get_device_password(x_session_id, str(device_id)),
+        auto_sync=True
+    )
 
-        # Get status using ISECNet protocol
-        success, status, message = await isecnet_client.get_status(
-            device_id=device_id,
-            mac=conn_info.mac,
-            password=password,
-            use_ip_receiver=conn_info.use_ip_receiver,
-            ip_receiver_addr=conn_info.ip_receiver_addr,
-            ip_receiver_port=conn_info.ip_receiver_port,
-            ip_receiver_account=conn_info.ip_receiver_account
-        )
 
-        if not success:
-            raise APIConnectionError(f"Failed to get status: {message}")
+def _utc_iso_now() -> str:
+    """Current UTC time as a naive ISO string, formatted at most once per second."""
+    global _utc_iso_cache
+    now = int(time.time())
+    if now != _utc_iso_cache[0]:
+        _utc_iso_cache = (now, datetime.fromtimestamp(now, tz=timezone.utc).replace(tzinfo=None).isoformat())
+    return _utc_iso_cache[1]
 
-        # Cache partitions_enabled for arm/disarm commands
-        await state_manager.set_device_partitions_enabled(device_id, status.partitions_enabled)
-
-        # Convert partitions to response format
-        partitions = [
-            PartitionStatusInfo(index=p["index"], state=p["state"])
-            for p in status.partitions
-        ]
-
-        # Convert zones to response format
-        zones = [
-            ZoneStatusInfo(
-                index=z["index"],
-                name=f"Zona {z['index'] + 1:02d}",
-                is_open=z.get("open", False),
-                is_bypassed=z.get("bypassed", False),
-                is_wireless=z.get("is_wireless", False),
-                battery_low=z.get("battery_low", False),
-                signal_strength=z.get("signal"),
-                tamper=z.get("tamper", False),
-                is_in_alarm=z.get("triggered", False),
-            )
-            for z in status.zones
-        ]
 
-        return AlarmStatusResponse(
-            device_id=device_id,
-            model=status.model,
-            mac=conn_info.mac,
-            is_armed=status.is_armed,
-            arm_mode=status.arm_mode,
-            is_triggered=status.is_triggered,
-            partitions=partitions,
-            partitions_enabled=status.partitions_enabled,
-            zones=zones,
-            message="Status retrieved successfully",
-            # Eletrificador-specific fields
-            is_eletrificador=status.is_eletrificador,
-            shock_enabled=status.shock_enabled,
-            shock_triggered=status.shock_triggered,
-            alarm_enabled=status.alarm_enabled,
-            alarm_triggered=status.alarm_triggered
-        )
+async def _auto_status_etag(device_id: int, status_response: Union[AlarmStatusResponse, Dict[str, Any]]) -> str:
+    """ETag of an auto-sync response, taken from the last known status snapshot.
 
-    except InvalidSessionError as e:
-        raise HTTPException(status_code=401, detail=str(e.message))
-    except AlarmOperationError as e:
-        raise HTTPException(status_code=400, detail=str(e.message))
-    except DeviceNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e.message))
-    except APIConnectionError as e:
-        raise HTTPException(status_code=503, detail=str(e.message))
-    except Exception as e:
-        logger.error(f"Unexpected error getting status: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    Responses served from the snapshot because the panel is unreachable get
+    a distinct tag, so clients still see connection_unavailable flip.
+    """
+    etag = await state_manager.get_last_known_etag(device_id) or '""'
+    if isinstance(status_response, dict) and status_response["connection_unavailable"]:
+        etag = etag[:-1] + '-stale"'
+    return etag
 
 
 @router.get("/{device_id}/status/auto", response_model=AlarmStatusResponse)
+@_alarm_endpoint("getting auto status")
 async def get_alarm_status_auto(
     device_id: int,
-    x_session_id: str = Header(..., alias="X-Session-ID")
+    response: Response,
+    x_session_id: str = Header(..., alias="X-Session-ID"),
+    wait: int = Query(0, ge=0, le=55, description="Long-poll: seconds to hold the request while status matches If-None-Match"),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match")
 ):
     """
     Get current alarm status using saved password.
@@ -860,188 +1192,188 @@ async def get_alarm_status_auto(
     the connection), this endpoint will return the last known status with
     `connection_unavailable: true` flag.
 
-    NOTE: This endpoint disconnects after getting status to allow
-    sequential syncing of multiple devices without conflicts.
+    Every response carries an ETag over the status (excluding timestamps and
+    messages). Sending it back as If-None-Match returns 304 when nothing
+    changed; with `wait` the request is held for up to that many seconds
+    until another poll, command or cloud event changes the last known
+    status (long-poll) instead of being polled repeatedly.
 
     Args:
         device_id: Alarm central ID
+        wait: Seconds to hold a conditional request waiting for a change (0-55)
 
     Requires X-Session-ID header from login and a saved password for the device.
     """
-    try:
-        # Get valid token to fetch device info
-        access_token = await auth_service.get_valid_token(x_session_id)
+    status_response = await _get_auto_status(device_id, x_session_id)
+    etag = await _auto_status_etag(device_id, status_response)
+
+    # Conditional/long-poll request: hold it while the last known status
+    # still matches the client's snapshot. Waiters only compare the
+    # snapshot's precomputed ETag; the panel isn't re-polled per client.
+    if if_none_match is not None and if_none_match == etag:
+        deadline = time.monotonic() + wait
+        while etag == if_none_match:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return Response(status_code=304, headers={"ETag": etag})
+            if await state_manager.await_state_change(device_id, remaining):
+                etag = await state_manager.get_last_known_etag(device_id) or etag
+        last_known = await state_manager.get_last_known_status(device_id)
+        status_response = _last_known_response(
+            device_id, last_known, "Auto-sync status retrieved successfully",
+            connection_unavailable=False,
+        )
 
-        # Get saved password
-        password = await state_manager.get_device_password(x_session_id, str(device_id))
-        if not password:
-            raise AlarmOperationError("No saved password for this device. Save a password first.")
+    if isinstance(status_response, dict):
+        # Served from the last known status, already in the response shape
+        return ORJSONResponse(status_response, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return status_response
 
-        # Get device connection info from cloud API
-        conn_info = await _get_device_connection_info(access_token, device_id)
-        if not conn_info:
-            raise DeviceNotFoundError(f"Device {device_id} not found or connection info not available")
 
-        conn_type = "IP Receiver" if conn_info.use_ip_receiver else "Cloud"
-        logger.info(f"Auto-sync status for device {device_id} (MAC: {conn_info.mac}) via {conn_type}")
+@dataclass
+class _StatusFeed:
+    """Latest auto-sync status of one device, shared by its stream clients."""
+    subscribers: int = 0
+    etag: Optional[str] = None
+    data: str = ""
+    # Set when the feed stops for good (e.g. session expired)
+    error: Optional[str] = None
+    # Replaced after every publish; clients wait on the current one
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+    task: Optional["asyncio.Task[None]"] = None
+
+    def publish(self) -> None:
+        """Wake up all clients waiting for the next update."""
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+
+# Status stream feeds keyed by (session_id, device_id); one panel poller per
+# feed however many clients are connected
+_status_feeds: Dict[Tuple[str, int], _StatusFeed] = {}
+
+
+async def _poll_status_feed(feed: _StatusFeed, device_id: int, session_id: str) -> None:
+    """Poll the auto-sync status for a feed and publish every change."""
+    while True:
+        try:
+            status_response = await _get_auto_status(device_id, session_id)
+        except (InvalidSessionError, AlarmOperationError) as e:
+            # Won't recover by retrying (session expired, saved password removed)
+            feed.error = orjson.dumps({"error": type(e).__name__, "message": e.message}).decode()
+            feed.publish()
+            return
+        except Exception as e:
+            logger.warning(f"Status stream poll failed for device {device_id}: {e}")
+        else:
+            etag = await _auto_status_etag(device_id, status_response)
+            if etag != feed.etag:
+                payload = status_response if isinstance(status_response, dict) else status_response.model_dump()
+                feed.etag = etag
+                feed.data = orjson.dumps(payload).decode()
+                feed.publish()
+
+        # Re-poll on reported state changes (commands, cloud events) or
+        # periodically otherwise
+        await state_manager.await_state_change(device_id, _STATUS_STREAM_INTERVAL)
+
+
+async def _status_stream(device_id: int, session_id: str) -> AsyncGenerator[str, None]:
+    """
+    Generate SSE status events for a client.
 
-        # Get status using ISECNet protocol
-        success, status, message = await isecnet_client.get_status(
-            device_id=device_id,
-            mac=conn_info.mac,
-            password=password,
-            use_ip_receiver=conn_info.use_ip_receiver,
-            ip_receiver_addr=conn_info.ip_receiver_addr,
-            ip_receiver_port=conn_info.ip_receiver_port,
-            ip_receiver_account=conn_info.ip_receiver_account
-        )
+    Yields the current status, then every change, with keep-alive comments
+    in between so idle proxies don't drop the connection.
+    """
+    key = (session_id, device_id)
+    feed = _status_feeds.get(key)
+    if feed is None:
+        feed = _status_feeds[key] = _StatusFeed()
+    feed.subscribers += 1
+    if feed.task is None:
+        feed.task = asyncio.create_task(_poll_status_feed(feed, device_id, session_id))
 
-        # Keep connection alive for fast subsequent polls.
-        # The ISECNet client's keep-alive loop handles idle cleanup (5 min timeout).
-        # Only disconnect on failure (handled below).
-
-        # If connection failed, try to return last known status
-        if not success:
-            logger.warning(f"Failed to get real-time status for device {device_id}: {message}")
-
-            # Try to get last known status from persistent cache
-            last_known = await state_manager.get_last_known_status(device_id)
-            if last_known:
-                logger.info(f"Returning last known status for device {device_id} (from {last_known.get('_last_updated')})")
-
-                # Convert cached data to response format
-                partitions = [
-                    PartitionStatusInfo(index=p["index"], state=p["state"])
-                    for p in last_known.get("partitions", [])
-                ]
-                zones = [
-                    ZoneStatusInfo(
-                        index=z["index"],
-                        name=z.get("name", f"Zona {z['index'] + 1:02d}"),
-                        is_open=z.get("is_open", False),
-                        is_bypassed=z.get("is_bypassed", False),
-                        is_wireless=z.get("is_wireless", False),
-                        battery_low=z.get("battery_low", False),
-                        signal_strength=z.get("signal_strength"),
-                        tamper=z.get("tamper", False),
-                        is_in_alarm=z.get("is_in_alarm", False),
-                    )
-                    for z in last_known.get("zones", [])
-                ]
-
-                return AlarmStatusResponse(
-                    device_id=device_id,
-                    model=last_known.get("model"),
-                    mac=last_known.get("mac"),
-                    is_armed=last_known.get("is_armed", False),
-                    arm_mode=last_known.get("arm_mode", "disarmed"),
-                    is_triggered=last_known.get("is_triggered", False),
-                    partitions=partitions,
-                    partitions_enabled=last_known.get("partitions_enabled", False),
-                    zones=zones,
-                    message=f"Conexao indisponivel - usando ultimo estado conhecido. Erro: {message}",
-                    # Eletrificador-specific fields
-                    is_eletrificador=last_known.get("is_eletrificador", False),
-                    shock_enabled=last_known.get("shock_enabled", False),
-                    shock_triggered=last_known.get("shock_triggered", False),
-                    alarm_enabled=last_known.get("alarm_enabled", False),
-                    alarm_triggered=last_known.get("alarm_triggered", False),
-                    # Connection status
-                    connection_unavailable=True,
-                    last_updated=last_known.get("_last_updated")
-                )
-            else:
-                # No cached status available - raise error
-                raise APIConnectionError(f"Failed to get status: {message}")
-
-        # Cache partitions_enabled for arm/disarm commands
-        # This is crucial because after disconnect, the protocol instance is destroyed
-        # and we need this info to know whether to include partition byte in commands
-        await state_manager.set_device_partitions_enabled(device_id, status.partitions_enabled)
-        logger.debug(f"Cached partitions_enabled={status.partitions_enabled} for device {device_id}")
-
-        # Convert partitions to response format
-        partitions = [
-            PartitionStatusInfo(index=p["index"], state=p["state"])
-            for p in status.partitions
-        ]
-
-        # Convert zones to response format
-        zones = [
-            ZoneStatusInfo(
-                index=z["index"],
-                name=f"Zona {z['index'] + 1:02d}",
-                is_open=z.get("open", False),
-                is_bypassed=z.get("bypassed", False),
-                is_wireless=z.get("is_wireless", False),
-                battery_low=z.get("battery_low", False),
-                signal_strength=z.get("signal"),
-                tamper=z.get("tamper", False),
-                is_in_alarm=z.get("triggered", False),
-            )
-            for z in status.zones
-        ]
+    try:
+        sent_etag = None
+        while True:
+            # Grab the event before checking so a publish in between isn't missed
+            changed = feed.changed
+            if feed.error is not None:
+                yield f"event: error\ndata: {feed.error}\n\n"
+                return
+            if feed.etag is not None and feed.etag != sent_etag:
+                sent_etag = feed.etag
+                yield f"event: status\nid: {sent_etag}\ndata: {feed.data}\n\n"
+
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=_STATUS_STREAM_PING)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+
+    except asyncio.CancelledError:
+        pass
+    finally:
+        feed.subscribers -= 1
+        if feed.subscribers == 0:
+            # Last client gone - stop polling the panel for this feed
+            if feed.task is not None:
+                feed.task.cancel()
+            if _status_feeds.get(key) is feed:
+                del _status_feeds[key]
+
+
+@router.get("/{device_id}/status/stream")
+@_alarm_endpoint("opening status stream")
+async def stream_alarm_status(
+    device_id: int,
+    x_session_id: str = Header(None, alias="X-Session-ID"),
+    session_id: str = Query(None, description="Session ID (alternative to header)")
+):
+    """
+    Stream alarm status using Server-Sent Events (SSE).
 
-        # Save last known status for future connection failures
-        from datetime import datetime
-        last_known_data = {
-            "model": status.model,
-            "mac": conn_info.mac,
-            "is_armed": status.is_armed,
-            "arm_mode": status.arm_mode,
-            "is_triggered": status.is_triggered,
-            "partitions": [{"index": p.index, "state": p.state} for p in partitions],
-            "partitions_enabled": status.partitions_enabled,
-            "zones": [{
-                "index": z.index, "name": z.name, "is_open": z.is_open,
-                "is_bypassed": z.is_bypassed, "is_wireless": z.is_wireless,
-                "battery_low": z.battery_low, "signal_strength": z.signal_strength,
-                "tamper": z.tamper, "is_in_alarm": z.is_in_alarm,
-            } for z in zones],
-            "is_eletrificador": status.is_eletrificador,
-            "shock_enabled": status.shock_enabled,
-            "shock_triggered": status.shock_triggered,
-            "alarm_enabled": status.alarm_enabled,
-            "alarm_triggered": status.alarm_triggered,
-        }
-        await state_manager.set_last_known_status(device_id, last_known_data)
+    Push-based alternative to polling GET /status/auto: the current status is
+    sent on connect and again whenever it changes. The panel is polled once
+    per device and session, however many clients are connected.
 
-        return AlarmStatusResponse(
-            device_id=device_id,
-            model=status.model,
-            mac=conn_info.mac,
-            is_armed=status.is_armed,
-            arm_mode=status.arm_mode,
-            is_triggered=status.is_triggered,
-            partitions=partitions,
-            partitions_enabled=status.partitions_enabled,
-            zones=zones,
-            message="Auto-sync status retrieved successfully",
-            # Eletrificador-specific fields
-            is_eletrificador=status.is_eletrificador,
-            shock_enabled=status.shock_enabled,
-            shock_triggered=status.shock_triggered,
-            alarm_enabled=status.alarm_enabled,
-            alarm_triggered=status.alarm_triggered,
-            # Connection status
-            connection_unavailable=False,
-            last_updated=datetime.utcnow().isoformat()
+    Event types:
+    - status: Same body as GET /status/auto (id is its ETag)
+    - error: Stream ended (session expired or no saved password)
+
+    Requires X-Session-ID header or session_id query parameter, and a saved
+    password for the device.
+    """
+    # Accept session from header or query param (EventSource doesn't support headers)
+    effective_session_id = x_session_id or session_id
+
+    if not effective_session_id:
+        raise HTTPException(
+            status_code=401,
+            detail="Session ID required (X-Session-ID header or session_id query param)"
         )
 
-    except InvalidSessionError as e:
-        raise HTTPException(status_code=401, detail=str(e.message))
-    except AlarmOperationError as e:
-        raise HTTPException(status_code=400, detail=str(e.message))
-    except DeviceNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e.message))
-    except APIConnectionError as e:
-        raise HTTPException(status_code=503, detail=str(e.message))
-    except Exception as e:
-        logger.error(f"Unexpected error getting auto status: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # Validate session and saved password before opening the stream
+    _, password = await asyncio.gather(
+        auth_service.get_valid_token(effective_session_id),
+        state_manager.get_device_password(effective_session_id, str(device_id)),
+    )
+    if not password:
+        raise AlarmOperationError("No saved password for this device. Save a password first.")
+
+    return StreamingResponse(
+        _status_stream(device_id, effective_session_id),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        }
+    )
 
 
 @router.get("/{device_id}/info")
+@_alarm_endpoint("getting alarm info")
 async def get_alarm_info(
     device_id: int,
     x_session_id: str = Header(..., alias="X-Session-ID")
@@ -1054,32 +1386,22 @@ async def get_alarm_info(
 
     Requires X-Session-ID header from login.
     """
-    try:
-        # Get valid token
-        access_token = await auth_service.get_valid_token(x_session_id)
-
-        # Fetch device info from cloud API
-        raw_devices = await guardian_client.get_alarm_centrals(access_token)
-
-        for device in raw_devices:
-            if device.get("id") == device_id:
-                return {
-                    "device_id": device_id,
-                    "description": device.get("description"),
-                    "mac": device.get("central_mac") or device.get("mac"),
-                    "model": device.get("alarm_model") or device.get("model"),
-                    "partitions": device.get("partitions", []),
-                    "zones": device.get("sectors", device.get("zones", []))
-                }
+    # Get valid token
+    access_token = await auth_service.get_valid_token(x_session_id)
 
-        raise DeviceNotFoundError(f"Device {device_id} not found")
+    # Fetch device info from cloud API (shares the short per-token memo)
+    device = await _get_device_record(access_token, device_id)
+    if device is not None:
+        return {
+            "device_id": device_id,
+            "description": device.get("description"),
+            "mac": device.get("central_mac") or device.get("mac"),
+            "model": device.get("alarm_model") or device.get("model"),
+            "partitions": device.get("partitions", []),
+            "zones": device.get("sectors", device.get("zones", []))
+        }
 
-    except InvalidSessionError as e:
-        raise HTTPException(status_code=401, detail=str(e.message))
-    except DeviceNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e.message))
-    except APIConnectionError as e:
-        raise HTTPException(status_code=503, detail=str(e.message))
+    raise DeviceNotFoundError(f"Device {device_id} not found")
 
 
 class EletrificadorRequest(BaseModel):
@@ -1097,6 +1419,7 @@ class EletrificadorOperationResponse(BaseModel):
 
 
 @router.post("/{device_id}/eletrificador/activate", response_model=EletrificadorOperationResponse)
+@_alarm_endpoint("activating eletrificador")
 async def activate_eletrificador(
     device_id: int,
     request: EletrificadorRequest,
@@ -1118,62 +1441,25 @@ async def activate_eletrificador(
 
     Requires X-Session-ID header from login.
     """
-    try:
-        # Get valid token to fetch device info
-        access_token = await auth_service.get_valid_token(x_session_id)
-
-        # Get password (from request or saved)
-        password = await _get_password(x_session_id, device_id, request.password, request.save_password)
-        if not password:
-            raise AlarmOperationError("Password required. Provide password or save one first.")
-
-        # Get device connection info from cloud API
-        conn_info = await _get_device_connection_info(access_token, device_id)
-        if not conn_info:
-            raise DeviceNotFoundError(f"Device {device_id} not found or connection info not available")
-
-        conn_type = "IP Receiver" if conn_info.use_ip_receiver else "Cloud"
-        logger.info(f"Activating (arming) eletrificador ALARM {device_id} (MAC: {conn_info.mac}) via {conn_type}")
-
-        # Activate = ARM the alarm using dedicated eletrificador method (partition_index=0)
-        # This controls ONLY the alarm, not the shock
-        success, message = await isecnet_client.eletrificador_alarm_on(
-            device_id=device_id,
-            mac=conn_info.mac,
-            password=password,
-            use_ip_receiver=conn_info.use_ip_receiver,
-            ip_receiver_addr=conn_info.ip_receiver_addr,
-            ip_receiver_port=conn_info.ip_receiver_port,
-            ip_receiver_account=conn_info.ip_receiver_account
-        )
-
-        if not success:
-            raise AlarmOperationError(f"Failed to activate alarm: {message}")
-
-        # Clear device cache to force refresh
-        await state_manager.delete_device_state(device_id)
-
-        return EletrificadorOperationResponse(
-            success=True,
-            device_id=device_id,
-            new_status="alarm_armed",
-            message="Alarme do eletrificador ARMADO com sucesso"
-        )
-
-    except InvalidSessionError as e:
-        raise HTTPException(status_code=401, detail=str(e.message))
-    except AlarmOperationError as e:
-        raise HTTPException(status_code=400, detail=str(e.message))
-    except DeviceNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e.message))
-    except APIConnectionError as e:
-        raise HTTPException(status_code=503, detail=str(e.message))
-    except Exception as e:
-        logger.error(f"Unexpected error activating eletrificador: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # Activate = ARM the alarm using dedicated eletrificador method (partition_index=0)
+    # This controls ONLY the alarm, not the shock
+    await _run_isecnet_op(
+        x_session_id, device_id, request,
+        op="eletrificador_alarm_on",
+        log_action="Activating (arming) eletrificador ALARM",
+        failure="Failed to activate alarm"
+    )
+
+    return EletrificadorOperationResponse(
+        success=True,
+        device_id=device_id,
+        new_status="alarm_armed",
+        message="Alarme do eletrificador ARMADO com sucesso"
+    )
 
 
 @router.post("/{device_id}/eletrificador/deactivate", response_model=EletrificadorOperationResponse)
+@_alarm_endpoint("deactivating eletrificador")
 async def deactivate_eletrificador(
     device_id: int,
     request: EletrificadorRequest,
@@ -1195,62 +1481,25 @@ async def deactivate_eletrificador(
 
     Requires X-Session-ID header from login.
     """
-    try:
-        # Get valid token to fetch device info
-        access_token = await auth_service.get_valid_token(x_session_id)
-
-        # Get password (from request or saved)
-        password = await _get_password(x_session_id, device_id, request.password, request.save_password)
-        if not password:
-            raise AlarmOperationError("Password required. Provide password or save one first.")
-
-        # Get device connection info from cloud API
-        conn_info = await _get_device_connection_info(access_token, device_id)
-        if not conn_info:
-            raise DeviceNotFoundError(f"Device {device_id} not found or connection info not available")
-
-        conn_type = "IP Receiver" if conn_info.use_ip_receiver else "Cloud"
-        logger.info(f"Deactivating (disarming) eletrificador ALARM {device_id} (MAC: {conn_info.mac}) via {conn_type}")
-
-        # Deactivate = DISARM the alarm using dedicated eletrificador method (partition_index=0)
-        # This controls ONLY the alarm, not the shock
-        success, message = await isecnet_client.eletrificador_alarm_off(
-            device_id=device_id,
-            mac=conn_info.mac,
-            password=password,
-            use_ip_receiver=conn_info.use_ip_receiver,
-            ip_receiver_addr=conn_info.ip_receiver_addr,
-            ip_receiver_port=conn_info.ip_receiver_port,
-            ip_receiver_account=conn_info.ip_receiver_account
-        )
-
-        if not success:
-            raise AlarmOperationError(f"Failed to deactivate alarm: {message}")
-
-        # Clear device cache to force refresh
-        await state_manager.delete_device_state(device_id)
-
-        return EletrificadorOperationResponse(
-            success=True,
-            device_id=device_id,
-            new_status="alarm_disarmed",
-            message="Alarme do eletrificador DESARMADO com sucesso"
-        )
-
-    except InvalidSessionError as e:
-        raise HTTPException(status_code=401, detail=str(e.message))
-    except AlarmOperationError as e:
-        raise HTTPException(status_code=400, detail=str(e.message))
-    except DeviceNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e.message))
-    except APIConnectionError as e:
-        raise HTTPException(status_code=503, detail=str(e.message))
-    except Exception as e:
-        logger.error(f"Unexpected error deactivating eletrificador: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # Deactivate = DISARM the alarm using dedicated eletrificador method (partition_index=0)
+    # This controls ONLY the alarm, not the shock
+    await _run_isecnet_op(
+        x_session_id, device_id, request,
+        op="eletrificador_alarm_off",
+        log_action="Deactivating (disarming) eletrificador ALARM",
+        failure="Failed to deactivate alarm"
+    )
+
+    return EletrificadorOperationResponse(
+        success=True,
+        device_id=device_id,
+        new_status="alarm_disarmed",
+        message="Alarme do eletrificador DESARMADO com sucesso"
+    )
 
 
 @router.post("/{device_id}/eletrificador/shock/on", response_model=EletrificadorOperationResponse)
+@_alarm_endpoint("turning shock on")
 async def shock_on(
     device_id: int,
     request: EletrificadorRequest,
@@ -1271,61 +1520,24 @@ async def shock_on(
 
     Requires X-Session-ID header from login.
     """
-    try:
-        # Get valid token to fetch device info
-        access_token = await auth_service.get_valid_token(x_session_id)
-
-        # Get password (from request or saved)
-        password = await _get_password(x_session_id, device_id, request.password, request.save_password)
-        if not password:
-            raise AlarmOperationError("Password required. Provide password or save one first.")
-
-        # Get device connection info from cloud API
-        conn_info = await _get_device_connection_info(access_token, device_id)
-        if not conn_info:
-            raise DeviceNotFoundError(f"Device {device_id} not found or connection info not available")
-
-        conn_type = "IP Receiver" if conn_info.use_ip_receiver else "Cloud"
-        logger.info(f"Turning SHOCK ON for eletrificador {device_id} (MAC: {conn_info.mac}) via {conn_type}")
-
-        # Use shock_on command (SYSTEM_ARM_DISARM with partition_index=1)
-        success, message = await isecnet_client.shock_on(
-            device_id=device_id,
-            mac=conn_info.mac,
-            password=password,
-            use_ip_receiver=conn_info.use_ip_receiver,
-            ip_receiver_addr=conn_info.ip_receiver_addr,
-            ip_receiver_port=conn_info.ip_receiver_port,
-            ip_receiver_account=conn_info.ip_receiver_account
-        )
-
-        if not success:
-            raise AlarmOperationError(f"Failed to turn shock on: {message}")
-
-        # Clear device cache to force refresh
-        await state_manager.delete_device_state(device_id)
-
-        return EletrificadorOperationResponse(
-            success=True,
-            device_id=device_id,
-            new_status="shock_on",
-            message="Choque LIGADO com sucesso"
-        )
-
-    except InvalidSessionError as e:
-        raise HTTPException(status_code=401, detail=str(e.message))
-    except AlarmOperationError as e:
-        raise HTTPException(status_code=400, detail=str(e.message))
-    except DeviceNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e.message))
-    except APIConnectionError as e:
-        raise HTTPException(status_code=503, detail=str(e.message))
-    except Exception as e:
-        logger.error(f"Unexpected error turning shock on: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # Use shock_on command (SYSTEM_ARM_DISARM with partition_index=1)
+    await _run_isecnet_op(
+        x_session_id, device_id, request,
+        op="shock_on",
+        log_action="Turning SHOCK ON for eletrificador",
+        failure="Failed to turn shock on"
+    )
+
+    return EletrificadorOperationResponse(
+        success=True,
+        device_id=device_id,
+        new_status="shock_on",
+        message="Choque LIGADO com sucesso"
+    )
 
 
 @router.post("/{device_id}/eletrificador/shock/off", response_model=EletrificadorOperationResponse)
+@_alarm_endpoint("turning shock off")
 async def shock_off(
     device_id: int,
     request: EletrificadorRequest,
@@ -1346,65 +1558,29 @@ async def shock_off(
 
     Requires X-Session-ID header from login.
     """
-    try:
-        # Get valid token to fetch device info
-        access_token = await auth_service.get_valid_token(x_session_id)
-
-        # Get password (from request or saved)
-        password = await _get_password(x_session_id, device_id, request.password, request.save_password)
-        if not password:
-            raise AlarmOperationError("Password required. Provide password or save one first.")
-
-        # Get device connection info from cloud API
-        conn_info = await _get_device_connection_info(access_token, device_id)
-        if not conn_info:
-            raise DeviceNotFoundError(f"Device {device_id} not found or connection info not available")
-
-        conn_type = "IP Receiver" if conn_info.use_ip_receiver else "Cloud"
-        logger.info(f"Turning SHOCK OFF for eletrificador {device_id} (MAC: {conn_info.mac}) via {conn_type}")
-
-        # Use shock_off command (SYSTEM_ARM_DISARM with partition_index=1)
-        success, message = await isecnet_client.shock_off(
-            device_id=device_id,
-            mac=conn_info.mac,
-            password=password,
-            use_ip_receiver=conn_info.use_ip_receiver,
-            ip_receiver_addr=conn_info.ip_receiver_addr,
-            ip_receiver_port=conn_info.ip_receiver_port,
-            ip_receiver_account=conn_info.ip_receiver_account
-        )
-
-        if not success:
-            raise AlarmOperationError(f"Failed to turn shock off: {message}")
-
-        # Clear device cache to force refresh
-        await state_manager.delete_device_state(device_id)
-
-        return EletrificadorOperationResponse(
-            success=True,
-            device_id=device_id,
-            new_status="shock_off",
-            message="Choque DESLIGADO com sucesso"
-        )
-
-    except InvalidSessionError as e:
-        raise HTTPException(status_code=401, detail=str(e.message))
-    except AlarmOperationError as e:
-        raise HTTPException(status_code=400, detail=str(e.message))
-    except DeviceNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e.message))
-    except APIConnectionError as e:
-        raise HTTPException(status_code=503, detail=str(e.message))
-    except Exception as e:
-        logger.error(f"Unexpected error turning shock off: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # Use shock_off command (SYSTEM_ARM_DISARM with partition_index=1)
+    await _run_isecnet_op(
+        x_session_id, device_id, request,
+        op="shock_off",
+        log_action="Turning SHOCK OFF for eletrificador",
+        failure="Failed to turn shock off"
+    )
+
+    return EletrificadorOperationResponse(
+        success=True,
+        device_id=device_id,
+        new_status="shock_off",
+        message="Choque DESLIGADO com sucesso"
+    )
 
 
 @router.post("/{device_id}/siren/off", response_model=EletrificadorOperationResponse)
+@_alarm_endpoint("turning off siren")
 async def turn_off_siren(
     device_id: int,
     request: EletrificadorRequest,
-    x_session_id: str = Header(..., alias="X-Session-ID")
+    x_session_id: str = Header(..., alias="X-Session-ID"),
+    skip_if_off: bool = Query(False, description="Don't send the command if a recent status shows the siren off")
 ):
     """
     Turn off the alarm siren without changing the arm/disarm state.
@@ -1412,89 +1588,62 @@ async def turn_off_siren(
     This silences the siren while keeping the alarm in its current state
     (armed_away, armed_home, etc).
 
+    With skip_if_off=true the command is not sent when a status read in
+    the last few seconds shows no alarm and no alarm event arrived since
+    (repeated siren-off calls from automations become no-ops).
+
     Args:
         device_id: Alarm central ID
         request: Request with password (optional if saved)
+        skip_if_off: Skip the command if the siren is known to be off
 
     Requires X-Session-ID header from login.
     """
-    try:
-        # Get valid token to fetch device info
-        access_token = await auth_service.get_valid_token(x_session_id)
-
-        # Get password (from request or saved)
-        password = await _get_password(x_session_id, device_id, request.password, request.save_password)
-        if not password:
-            raise AlarmOperationError("Password required. Provide password or save one first.")
-
-        # Get device connection info from cloud API
-        conn_info = await _get_device_connection_info(access_token, device_id)
-        if not conn_info:
-            raise DeviceNotFoundError(f"Device {device_id} not found or connection info not available")
-
-        conn_type = "IP Receiver" if conn_info.use_ip_receiver else "Cloud"
-        logger.info(f"Turning siren OFF for device {device_id} (MAC: {conn_info.mac}) via {conn_type}")
-
-        # Turn off siren using ISECNet protocol
-        success, message = await isecnet_client.turn_off_siren(
+    # Session check and last known status lookup are independent
+    _, last_known = await asyncio.gather(
+        auth_service.get_valid_token(x_session_id),
+        state_manager.get_last_known_status(device_id),
+    )
+    # Get current arm mode from last known status
+    current_status = last_known.get("arm_mode", "disarmed") if last_known else "disarmed"
+
+    if skip_if_off and _siren_known_off(device_id, last_known):
+        logger.info(f"Siren already off for device {device_id} (recent status), skipping command")
+        return EletrificadorOperationResponse(
+            success=True,
             device_id=device_id,
-            mac=conn_info.mac,
-            password=password,
-            use_ip_receiver=conn_info.use_ip_receiver,
-            ip_receiver_addr=conn_info.ip_receiver_addr,
-            ip_receiver_port=conn_info.ip_receiver_port,
-            ip_receiver_account=conn_info.ip_receiver_account
+            new_status=current_status,
+            message="Sirene ja estava desligada"
         )
 
-        if not success:
-            # Check if this is a connection error
-            connection_errors = ["busy", "offline", "timeout", "connection", "not connected", "connect"]
-            is_connection_error = any(err in message.lower() for err in connection_errors)
-
-            if is_connection_error:
-                raise HTTPException(
-                    status_code=503,
-                    detail={
-                        "error": "ConnectionUnavailable",
-                        "message": f"Conexao com a central indisponivel: {message}. Verifique se o app AMT nao esta aberto.",
-                    }
-                )
-
-            raise AlarmOperationError(f"Failed to turn off siren: {message}")
-
-        # Broadcast SSE event - siren off doesn't change arm state,
-        # but we signal it so HA can clear the triggered state
-        # Get current arm mode from last known status
-        last_known = await state_manager.get_last_known_status(device_id)
-        current_status = last_known.get("arm_mode", "disarmed") if last_known else "disarmed"
-
-        await event_stream.broadcast_event({
+    await _run_isecnet_op(
+        x_session_id, device_id, request,
+        op="turn_off_siren",
+        log_action="Turning siren OFF for device",
+        failure="Failed to turn off siren",
+        check_connection=True,
+        invalidate_state=False
+    )
+
+    # Broadcast SSE event - siren off doesn't change arm state,
+    # but we signal it so HA can clear the triggered state.
+    # SSE fan-out doesn't need to hold up the response
+    _run_in_background(
+        event_stream.broadcast_event({
             "event_type": "state_changed",
             "device_id": device_id,
             "new_status": current_status,
             "source": "command",
-        }, event_type="alarm_event")
+        }, event_type="alarm_event"),
+        f"siren-off broadcast for device {device_id}",
+    )
 
-        return EletrificadorOperationResponse(
-            success=True,
-            device_id=device_id,
-            new_status=current_status,
-            message="Sirene desligada com sucesso"
-        )
-
-    except HTTPException:
-        raise
-    except InvalidSessionError as e:
-        raise HTTPException(status_code=401, detail=str(e.message))
-    except AlarmOperationError as e:
-        raise HTTPException(status_code=400, detail=str(e.message))
-    except DeviceNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e.message))
-    except APIConnectionError as e:
-        raise HTTPException(status_code=503, detail=str(e.message))
-    except Exception as e:
-        logger.error(f"Unexpected error turning off siren: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return EletrificadorOperationResponse(
+        success=True,
+        device_id=device_id,
+        new_status=current_status,
+        message="Sirene desligada com sucesso"
+    )
 
 
 class PanicRequest(BaseModel):
@@ -1505,6 +1654,7 @@ class PanicRequest(BaseModel):
 
 
 @router.post("/{device_id}/panic", response_model=EletrificadorOperationResponse)
+@_alarm_endpoint("triggering panic")
 async def trigger_panic(
     device_id: int,
     request: PanicRequest,
@@ -1521,188 +1671,140 @@ async def trigger_panic(
 
     Requires X-Session-ID header from login.
     """
-    try:
-        access_token = await auth_service.get_valid_token(x_session_id)
-
-        password = await _get_password(x_session_id, device_id, request.password, request.save_password)
-        if not password:
-            raise AlarmOperationError("Password required. Provide password or save one first.")
-
-        conn_info = await _get_device_connection_info(access_token, device_id)
-        if not conn_info:
-            raise DeviceNotFoundError(f"Device {device_id} not found or connection info not available")
-
-        panic_names = {0: "silencioso", 1: "audível", 2: "incêndio", 3: "médico"}
-        panic_name = panic_names.get(request.panic_type, f"tipo {request.panic_type}")
-        conn_type = "IP Receiver" if conn_info.use_ip_receiver else "Cloud"
-        logger.info(f"Triggering {panic_name} panic for device {device_id} (MAC: {conn_info.mac}) via {conn_type}")
-
-        success, message = await isecnet_client.trigger_panic(
-            device_id=device_id,
-            mac=conn_info.mac,
-            password=password,
-            panic_type=request.panic_type,
-            use_ip_receiver=conn_info.use_ip_receiver,
-            ip_receiver_addr=conn_info.ip_receiver_addr,
-            ip_receiver_port=conn_info.ip_receiver_port,
-            ip_receiver_account=conn_info.ip_receiver_account
-        )
-
-        if not success:
-            connection_errors = ["busy", "offline", "timeout", "connection", "not connected", "connect"]
-            is_connection_error = any(err in message.lower() for err in connection_errors)
-
-            if is_connection_error:
-                raise HTTPException(
-                    status_code=503,
-                    detail={
-                        "error": "ConnectionUnavailable",
-                        "message": f"Conexao com a central indisponivel: {message}. Verifique se o app AMT nao esta aberto.",
-                    }
-                )
-
-            raise AlarmOperationError(f"Failed to trigger panic: {message}")
-
-        return EletrificadorOperationResponse(
-            success=True,
-            device_id=device_id,
-            new_status="triggered",
-            message=f"Pânico {panic_name} disparado com sucesso"
-        )
-
-    except HTTPException:
-        raise
-    except InvalidSessionError as e:
-        raise HTTPException(status_code=401, detail=str(e.message))
-    except AlarmOperationError as e:
-        raise HTTPException(status_code=400, detail=str(e.message))
-    except DeviceNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e.message))
-    except APIConnectionError as e:
-        raise HTTPException(status_code=503, detail=str(e.message))
-    except Exception as e:
-        logger.error(f"Unexpected error triggering panic: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    panic_name = _PANIC_NAMES.get(request.panic_type, f"tipo {request.panic_type}")
+    await _run_isecnet_op(
+        x_session_id, device_id, request,
+        op="trigger_panic",
+        log_action=f"Triggering {panic_name} panic for device",
+        failure="Failed to trigger panic",
+        check_connection=True,
+        invalidate_state=False,
+        panic_type=request.panic_type
+    )
+
+    return EletrificadorOperationResponse(
+        success=True,
+        device_id=device_id,
+        new_status="triggered",
+        message=f"Pânico {panic_name} disparado com sucesso"
+    )
+
+
+# Debug complete-status: status command used per model (name, command byte)
+_DEBUG_STATUS_CMDS: Dict[str, Tuple[str, int]] = {
+    "AMT_2018_E_SMART": ("GET_SMART_STATUS (0x5D)", 93),
+    "AMT_1000_SMART": ("GET_SMART_STATUS (0x5D)", 93),
+    "AMT_4010": ("GET_EXTENDED_STATUS (0x5B)", 91),
+}
+_DEBUG_DEFAULT_STATUS_CMD = ("GET_PARTIAL_STATUS (0x5A)", 90)
+
+# Debug complete-status: one annotated byte, called as (index, byte, byte)
+_annotate_byte = "[{:3d}] 0x{:02X} ({:3d})".format
+
+# Known byte positions of the AMT 2018 E Smart complete status (0x5D response)
+_DEBUG_BYTE_MAP_2018: Dict[str, str] = {
+    "1": "0xE9 command echo",
+    "2-7": "Zone open (48 zones, 6 bytes)",
+    "8-13": "Zone violated/alarm (48 zones)",
+    "14-19": "Zone bypassed (48 zones)",
+    "20": "Model code",
+    "21": "Firmware version",
+    "22": "Partition config",
+    "23": "Partition armed status",
+    "32": "Battery level byte",
+    "39": "Output/siren status",
+    "40-45": "Enabled zones (48 zones)",
+    "46-57": "Partition zone assignment",
+    "58-63": "Stay zones",
+    "64-69": "Wireless device present (bitmap, 48 zones)",
+    "70-75": "Zone tamper (bitmap, 48 zones)",
+    "76-81": "Zone in short (bitmap, 48 zones)",
+    "82-87": "ZONE BATTERY LOW (bitmap, 48 zones)",
+    "94": "Stay armed status",
+    "95": "User partition permission",
+    "97-99": "Zone supervision failure",
+    "100-107": "Wireless device model",
+    "108-115": "WIRELESS DEVICE SIGNAL",
+    "132-134": "Zone supervision mode",
+    "135": "Zone type",
+}
 
 
 @router.get("/{device_id}/debug/complete-status")
+@_alarm_endpoint("getting complete status")
 async def get_complete_status_debug(
     device_id: int,
-    x_session_id: str = Header(..., alias="X-Session-ID")
+    x_session_id: str = Header(..., alias="X-Session-ID"),
+    annotate: bool = Query(True, description="Include the per-byte annotated list")
 ):
     """
     Debug endpoint: get complete status as raw hex.
 
     Returns the raw hex bytes from GET_COMPLETE_STATUS (0x53) command.
     Use this to analyze byte positions for wireless sensor data (battery, signal).
+    Pass annotate=false to leave out the (large) per-byte annotated list.
     """
-    try:
-        access_token = await auth_service.get_valid_token(x_session_id)
-
-        password = await state_manager.get_device_password(x_session_id, str(device_id))
-        if not password:
-            raise AlarmOperationError("No saved password for this device.")
-
-        conn_info = await _get_device_connection_info(access_token, device_id)
-        if not conn_info:
-            raise DeviceNotFoundError(f"Device {device_id} not found")
-
-        # Also get partial status for comparison
-        partial_success, partial_status, _ = await isecnet_client.get_status(
-            device_id=device_id,
-            mac=conn_info.mac,
-            password=password,
-            use_ip_receiver=conn_info.use_ip_receiver,
-            ip_receiver_addr=conn_info.ip_receiver_addr,
-            ip_receiver_port=conn_info.ip_receiver_port,
-            ip_receiver_account=conn_info.ip_receiver_account
-        )
-
-        # Get complete status
-        success, hex_str = await isecnet_client.get_complete_status_raw(
-            device_id=device_id,
-            mac=conn_info.mac,
-            password=password,
-            use_ip_receiver=conn_info.use_ip_receiver,
-            ip_receiver_addr=conn_info.ip_receiver_addr,
-            ip_receiver_port=conn_info.ip_receiver_port,
-            ip_receiver_account=conn_info.ip_receiver_account
-        )
-
-        if not success:
-            raise AlarmOperationError(f"Failed: {hex_str}")
-
-        # Format hex in groups for readability
-        raw_bytes = bytes.fromhex(hex_str)
-        formatted = " ".join(f"{b:02x}" for b in raw_bytes)
-        # Also show with byte index annotations
-        annotated = []
-        for i, b in enumerate(raw_bytes):
-            annotated.append(f"[{i:3d}] 0x{b:02X} ({b:3d})")
-
-        # Determine which command was used based on model
-        model_name = partial_status.model if partial_success else "unknown"
-        cmd_map = {
-            "AMT_2018_E_SMART": ("GET_SMART_STATUS (0x5D)", 93),
-            "AMT_1000_SMART": ("GET_SMART_STATUS (0x5D)", 93),
-            "AMT_4010": ("GET_EXTENDED_STATUS (0x5B)", 91),
-        }
-        cmd_info = cmd_map.get(model_name, ("GET_PARTIAL_STATUS (0x5A)", 90))
-
-        # Annotate known byte positions for AMT 2018 E Smart (0x5D response)
-        byte_map = {}
-        if len(raw_bytes) > 100:
-            byte_map = {
-                "1": "0xE9 command echo",
-                "2-7": "Zone open (48 zones, 6 bytes)",
-                "8-13": "Zone violated/alarm (48 zones)",
-                "14-19": "Zone bypassed (48 zones)",
-                "20": "Model code",
-                "21": "Firmware version",
-                "22": "Partition config",
-                "23": "Partition armed status",
-                "32": "Battery level byte",
-                "39": "Output/siren status",
-                "40-45": "Enabled zones (48 zones)",
-                "46-57": "Partition zone assignment",
-                "58-63": "Stay zones",
-                "64-69": "Wireless device present (bitmap, 48 zones)",
-                "70-75": "Zone tamper (bitmap, 48 zones)",
-                "76-81": "Zone in short (bitmap, 48 zones)",
-                "82-87": "ZONE BATTERY LOW (bitmap, 48 zones)",
-                "94": "Stay armed status",
-                "95": "User partition permission",
-                "97-99": "Zone supervision failure",
-                "100-107": "Wireless device model",
-                "108-115": "WIRELESS DEVICE SIGNAL",
-                "132-134": "Zone supervision mode",
-                "135": "Zone type",
-            }
+    # Token validation and saved password lookup are independent - run them together
+    access_token, password = await asyncio.gather(
+        auth_service.get_valid_token(x_session_id),
+        state_manager.get_device_password(x_session_id, str(device_id)),
+    )
+    if not password:
+        raise AlarmOperationError("No saved password for this device.")
 
-        return {
-            "device_id": device_id,
-            "model": model_name,
-            "command": cmd_info[0],
-            "command_byte": f"0x{cmd_info[1]:02X}",
-            "total_bytes": len(raw_bytes),
-            "hex_raw": hex_str,
-            "hex_formatted": formatted,
-            "bytes_annotated": annotated,
-            "byte_map": byte_map if byte_map else None,
-        }
+    conn_info = await _get_device_connection_info(access_token, device_id)
+    if not conn_info:
+        raise DeviceNotFoundError(f"Device {device_id} not found")
 
-    except InvalidSessionError as e:
-        raise HTTPException(status_code=401, detail=str(e.message))
-    except AlarmOperationError as e:
-        raise HTTPException(status_code=400, detail=str(e.message))
-    except DeviceNotFoundError as e:
-        raise HTTPException(status_code=404, detail=str(e.message))
-    except Exception as e:
-        logger.error(f"Debug complete status error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # Also get partial status for comparison. Both reads go through the
+    # same per-device ISECNet lock, so they stay sequential.
+    partial_success, partial_status, _ = await isecnet_client.get_status(
+        device_id=device_id,
+        mac=conn_info.mac,
+        password=password,
+        **conn_info.ipr_kwargs
+    )
+
+    # Get complete status
+    success, hex_str = await isecnet_client.get_complete_status_raw(
+        device_id=device_id,
+        mac=conn_info.mac,
+        password=password,
+        **conn_info.ipr_kwargs
+    )
+
+    if not success:
+        raise AlarmOperationError(f"Failed: {hex_str}")
+
+    # Format hex in groups for readability
+    raw_bytes = bytes.fromhex(hex_str)
+    formatted = raw_bytes.hex(" ")
+    # Also show with byte index annotations (on request)
+    annotated = [_annotate_byte(i, b, b) for i, b in enumerate(raw_bytes)] if annotate else None
+
+    # Determine which command was used based on model
+    model_name = partial_status.model if partial_success else "unknown"
+    cmd_info = _DEBUG_STATUS_CMDS.get(model_name, _DEBUG_DEFAULT_STATUS_CMD)
+
+    # Annotate known byte positions for AMT 2018 E Smart (0x5D response)
+    byte_map = _DEBUG_BYTE_MAP_2018 if len(raw_bytes) > 100 else None
+
+    # Plain dict (~10KB with annotations) - serialize directly, skipping jsonable_encoder
+    return ORJSONResponse({
+        "device_id": device_id,
+        "model": model_name,
+        "command": cmd_info[0],
+        "command_byte": f"0x{cmd_info[1]:02X}",
+        "total_bytes": len(raw_bytes),
+        "hex_raw": hex_str,
+        "hex_formatted": formatted,
+        "bytes_annotated": annotated,
+        "byte_map": byte_map,
+    })
 
 
 @router.post("/{device_id}/disconnect")
+@_alarm_endpoint("disconnecting device")
 async def disconnect_device(
     device_id: int,
     x_session_id: str = Header(..., alias="X-Session-ID")
@@ -1710,26 +1812,28 @@ async def disconnect_device(
     """
     Disconnect ISECNet connection to a device.
 
-    This closes the socket connection to the alarm panel.
-    Useful for freeing resources or forcing a fresh connection.
+    This closes the socket connection to the alarm panel and clears the
+    cached connection info. Useful for freeing resources or forcing a fresh
+    connection (e.g. after changing IP receiver settings).
 
     Args:
         device_id: Alarm central ID
 
     Requires X-Session-ID header from login.
     """
-    try:
-        # Validate session
-        await auth_service.get_valid_token(x_session_id)
-
-        # Disconnect
-        success, message = await isecnet_client.disconnect(device_id)
-
-        return {
-            "success": success,
-            "device_id": device_id,
-            "message": message
-        }
+    # Validate session
+    await auth_service.get_valid_token(x_session_id)
+
+    # Disconnect, and drop the cached connection info so the next command
+    # re-reads MAC / IP receiver settings from the cloud
+    (success, message), _ = await asyncio.gather(
+        isecnet_client.disconnect(device_id),
+        state_manager.delete_device_conn_info(device_id),
+    )
+
+    return {
+        "success": success,
+        "device_id": device_id,
+        "message": message
+    }
 
-    except InvalidSessionError as e:
-        raise HTTPException(status_code=401, detail=str(e.message))
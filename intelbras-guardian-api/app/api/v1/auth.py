@@ -4,8 +4,10 @@ Supports two authentication methods:
 1. OAuth PKCE (recommended): /auth/start -> /auth/callback
 2. Password grant (fallback): /auth/login
 """
+from pathlib import Path
+
 from fastapi import APIRouter, HTTPException, Header, Query, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
 from pydantic import BaseModel, EmailStr, Field
 from typing import Optional
 
@@ -192,6 +194,10 @@ async def oauth_callback_url(request: OAuthCallbackURLRequest):
         raise HTTPException(status_code=401, detail=str(e.message))
 
 
+# OAuth callback page (static; code/state are read client-side from the URL)
+_OAUTH_CALLBACK_PAGE = Path(__file__).resolve().parents[2] / "static" / "oauth-callback.html"
+
+
 @router.get("/oauth-callback", response_class=HTMLResponse)
 async def oauth_callback_redirect(
     code: str = Query(..., description="Authorization code"),
@@ -201,117 +207,7 @@ async def oauth_callback_redirect(
     OAuth callback endpoint - handles the redirect from Intelbras login.
 
     This is called automatically by the browser after login.
-    It shows a page with the code and instructions.
-    """
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Intelbras Guardian - Login Successful</title>
-        <style>
-            body {{
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                max-width: 600px;
-                margin: 50px auto;
-                padding: 20px;
-                background: #f5f5f5;
-            }}
-            .card {{
-                background: white;
-                padding: 30px;
-                border-radius: 8px;
-                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            }}
-            h1 {{ color: #28a745; }}
-            .code-box {{
-                background: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                padding: 15px;
-                margin: 15px 0;
-                word-break: break-all;
-                font-family: monospace;
-            }}
-            .btn {{
-                background: #007bff;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 4px;
-                cursor: pointer;
-                font-size: 14px;
-            }}
-            .btn:hover {{ background: #0056b3; }}
-        </style>
-    </head>
-    <body>
-        <div class="card">
-            <h1>✓ Login Successful!</h1>
-            <p>Authorization code received. You can now complete the authentication.</p>
-
-            <h3>Option 1: Copy the code</h3>
-            <div class="code-box">
-                <strong>Code:</strong> {code}
-            </div>
-            <div class="code-box">
-                <strong>State:</strong> {state}
-            </div>
-            <p>Use these in POST /api/v1/auth/callback</p>
-
-            <h3>Option 2: Use the full URL</h3>
-            <div class="code-box" id="fullUrl"></div>
-            <button class="btn" onclick="copyUrl()">Copy URL</button>
-            <p>Use this in POST /api/v1/auth/callback-url</p>
-
-            <h3>Option 3: Complete automatically</h3>
-            <p>Click the button below to complete authentication:</p>
-            <button class="btn" onclick="completeAuth()">Complete Login</button>
-            <div id="result" style="margin-top: 15px;"></div>
-        </div>
-
-        <script>
-            document.getElementById('fullUrl').textContent = window.location.href;
-
-            function copyUrl() {{
-                navigator.clipboard.writeText(window.location.href);
-                alert('URL copied to clipboard!');
-            }}
-
-            async function completeAuth() {{
-                const resultDiv = document.getElementById('result');
-                resultDiv.innerHTML = 'Processing...';
-
-                try {{
-                    const response = await fetch('/api/v1/auth/callback', {{
-                        method: 'POST',
-                        headers: {{ 'Content-Type': 'application/json' }},
-                        body: JSON.stringify({{
-                            code: '{code}',
-                            state: '{state}'
-                        }})
-                    }});
-
-                    const data = await response.json();
-
-                    if (response.ok) {{
-                        resultDiv.innerHTML = `
-                            <div style="color: green;">
-                                <strong>✓ Authentication Complete!</strong><br>
-                                Session ID: <code>${{data.session_id}}</code><br>
-                                Expires: ${{data.expires_at}}
-                            </div>
-                        `;
-                        // Store session in localStorage for Web UI
-                        localStorage.setItem('session_id', data.session_id);
-                    }} else {{
-                        resultDiv.innerHTML = `<div style="color: red;">Error: ${{data.detail}}</div>`;
-                    }}
-                }} catch (e) {{
-                    resultDiv.innerHTML = `<div style="color: red;">Error: ${{e.message}}</div>`;
-                }}
-            }}
-        </script>
-    </body>
-    </html>
+    It shows a page with the code and instructions. The page is a static
+    file that reads code/state from its own URL.
     """
-    return HTMLResponse(content=html)
+    return FileResponse(_OAUTH_CALLBACK_PAGE, media_type="text/html")
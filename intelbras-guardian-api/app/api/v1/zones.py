@@ -141,8 +141,8 @@ async def get_zones(
                     for zone in status.zones:
                         zones_status[zone["index"]] = zone
 
-                # Disconnect after getting status
-                await isecnet_client.disconnect(device_id)
+                # Connection stays pooled for the next call; the ISECNet
+                # client's keep-alive loop disconnects it once idle
         except Exception as e:
             logger.warning(f"Could not get real-time zone status: {e}")
 
@@ -171,7 +171,7 @@ async def get_zones(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error getting zones: {e}")
+        logger.exception("Unexpected error getting zones")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -209,7 +209,7 @@ async def update_zone_friendly_name(
     except InvalidSessionError as e:
         raise HTTPException(status_code=401, detail=str(e.message))
     except Exception as e:
-        logger.error(f"Unexpected error updating zone friendly name: {e}")
+        logger.exception("Unexpected error updating zone friendly name")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -236,7 +236,7 @@ async def delete_zone_friendly_name(
     except InvalidSessionError as e:
         raise HTTPException(status_code=401, detail=str(e.message))
     except Exception as e:
-        logger.error(f"Unexpected error deleting zone friendly name: {e}")
+        logger.exception("Unexpected error deleting zone friendly name")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -292,8 +292,8 @@ async def get_open_zones_for_device(device_id: int, session_id: str) -> List[Zon
                 ip_receiver_account=device_info.get("ip_receiver_server_account")
             )
 
-            # Disconnect after getting status
-            await isecnet_client.disconnect(device_id)
+            # Connection stays pooled for the next call (idle cleanup by the
+            # ISECNet client's keep-alive loop)
 
             if success and status.zones:
                 open_zones = []
@@ -70,6 +70,10 @@ class Settings(BaseSettings):
         default=30,
         description="HTTP request timeout in seconds"
     )
+    HTTP_KEEPALIVE_TIMEOUT: int = Field(
+        default=60,
+        description="Seconds an idle pooled HTTP connection to the Intelbras API is kept open"
+    )
     TOKEN_REFRESH_BUFFER: int = Field(
         default=300,
         description="Refresh token N seconds before expiration"
@@ -24,6 +24,7 @@ import uuid
 import platform
 import hashlib
 import base64
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, Tuple
 from urllib.parse import urlencode, urlparse, parse_qs
@@ -43,6 +44,9 @@ logger = logging.getLogger(__name__)
 # PKCE pending authentications storage (state -> (code_verifier, redirect_uri))
 _pending_auth: Dict[str, Tuple[str, str]] = {}
 
+# How long a validated access token is reused without re-checking the session
+_VALID_TOKEN_TTL = 10.0
+
 
 class AuthService:
     """
@@ -74,6 +78,8 @@ class AuthService:
         self._session: Optional[aiohttp.ClientSession] = None
         # Generate a persistent device ID for this middleware instance
         self._device_id = str(uuid.uuid4())
+        # Recently validated tokens: session_id -> (monotonic time, access token)
+        self._valid_tokens: Dict[str, Tuple[float, str]] = {}
 
     @staticmethod
     def _generate_code_verifier() -> str:
@@ -271,7 +277,7 @@ class AuthService:
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=settings.HTTP_TIMEOUT)
             # Skip SSL verification for testing (Intelbras uses self-signed certs sometimes)
-            connector = aiohttp.TCPConnector(ssl=False)
+            connector = aiohttp.TCPConnector(ssl=False, keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT)
             self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
         return self._session
 
@@ -588,9 +594,16 @@ class AuthService:
             InvalidSessionError: If session is invalid or expired
             TokenRefreshError: If token refresh fails
         """
+        # Bursts of commands on one session skip the lookup and expiry check.
+        # The refresh buffer keeps a memoized token valid well past the TTL.
+        cached = self._valid_tokens.get(session_id)
+        if cached is not None and time.monotonic() - cached[0] < _VALID_TOKEN_TTL:
+            return cached[1]
+
         token_data = await state_manager.get_token(session_id)
 
         if not token_data:
+            self._valid_tokens.pop(session_id, None)
             raise InvalidSessionError("Session not found or expired")
 
         expires_at_str = token_data.get("expires_at")
@@ -607,8 +620,19 @@ class AuthService:
                 except TokenRefreshError:
                     # If refresh fails, token may still be valid
                     if expires_at <= datetime.utcnow():
+                        self._valid_tokens.pop(session_id, None)
                         raise TokenExpiredError("Token expired and refresh failed")
 
+        now = time.monotonic()
+        # Drop entries of sessions that expired or went idle; the memo only
+        # ever holds sessions validated within the last TTL
+        stale = [
+            sid for sid, (validated_at, _) in self._valid_tokens.items()
+            if now - validated_at >= _VALID_TOKEN_TTL
+        ]
+        for sid in stale:
+            del self._valid_tokens[sid]
+        self._valid_tokens[session_id] = (now, token_data["access_token"])
         return token_data["access_token"]
 
     async def _refresh_token(self, session_id: str, token_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -708,6 +732,7 @@ class AuthService:
             True if logout successful
         """
         logger.info(f"Logging out session: {session_id[:8]}...")
+        self._valid_tokens.pop(session_id, None)
         await state_manager.delete_token(session_id)
         return True
 
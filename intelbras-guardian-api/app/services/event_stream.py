@@ -7,17 +7,34 @@ from typing import Any, Dict, List, Optional, Set
 from dataclasses import dataclass, field
 import json
 
+from app.services.state_manager import state_manager
+
 logger = logging.getLogger(__name__)
 
+# Event name keywords (matched as substrings of the lowercased name)
+_ALARM_WORDS = frozenset({"disparo", "alarme", "violacao", "panico"})
+_ARM_WORDS = frozenset({"ativacao", "arme", "armado"})
+_DISARM_WORDS = frozenset({"desativacao", "desarme", "desarmado"})
+
+# Pending events kept per SSE client; a client that falls further behind
+# loses its oldest events instead of holding up broadcasts
+_CLIENT_QUEUE_SIZE = 64
+
 
 @dataclass
 class SSEClient:
     """Represents a connected SSE client."""
     session_id: str
-    queue: asyncio.Queue = field(default_factory=asyncio.Queue)
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=_CLIENT_QUEUE_SIZE))
     connected_at: datetime = field(default_factory=datetime.utcnow)
     last_event_id: Optional[int] = None
 
+    def push(self, message: Dict[str, Any]) -> None:
+        """Queue a message without blocking, dropping the oldest one if full."""
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(message)
+
 
 class EventStreamManager:
     """
@@ -97,13 +114,17 @@ class EventStreamManager:
             event: Event data to broadcast
             event_type: SSE event type (default: "event")
         """
+        device_id = event.get("device_id")
+        if device_id is not None:
+            if event.get("is_alarm"):
+                state_manager.mark_alarm_event(device_id)
+            state_manager.notify_state_change(device_id)
+
+        message = {"type": event_type, "data": event}
         async with self._lock:
             for client_id, client in self._clients.items():
                 try:
-                    await client.queue.put({
-                        "type": event_type,
-                        "data": event
-                    })
+                    client.push(message)
                 except Exception as e:
                     logger.error(f"Error broadcasting to client {client_id[:8]}: {e}")
 
@@ -113,7 +134,7 @@ class EventStreamManager:
             client = self._clients.get(client_id)
             if client:
                 try:
-                    await client.queue.put({
+                    client.push({
                         "type": event_type,
                         "data": event
                     })
@@ -202,9 +223,9 @@ class EventStreamManager:
 
         # Determine event severity/type
         event_name = raw_event.get("name", "").lower()
-        is_alarm = any(word in event_name for word in ["disparo", "alarme", "violacao", "panico"])
-        is_arm = any(word in event_name for word in ["ativacao", "arme", "armado"])
-        is_disarm = any(word in event_name for word in ["desativacao", "desarme", "desarmado"])
+        is_alarm = any(word in event_name for word in _ALARM_WORDS)
+        is_arm = any(word in event_name for word in _ARM_WORDS)
+        is_disarm = any(word in event_name for word in _DISARM_WORDS)
 
         if is_alarm:
             severity = "critical"
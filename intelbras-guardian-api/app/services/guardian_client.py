@@ -41,7 +41,14 @@ class GuardianClient:
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self.timeout)
+            # Keep idle connections longer than aiohttp's 15s default so polls
+            # and commands a few seconds apart reuse the TLS connection
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(timeout=self.timeout, connector=connector)
         return self._session
 
     async def close(self):
@@ -176,6 +183,18 @@ class GuardianClient:
             return response.get("results", response.get("data", [response]))
         return []
 
+    async def get_alarm_centrals_by_id(self, access_token: str) -> Dict[int, Dict[str, Any]]:
+        """
+        Get alarm centrals keyed by device ID.
+
+        Args:
+            access_token: Valid access token
+
+        Returns:
+            Dict mapping device ID to alarm central dictionary
+        """
+        return {device.get("id"): device for device in await self.get_alarm_centrals(access_token)}
+
     async def get_partition_status(
         self,
         access_token: str,
@@ -1,8 +1,10 @@
 """State management for tokens and device cache."""
+import dataclasses
+import hashlib
 import logging
 import json
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
 from pathlib import Path
 import asyncio
 
@@ -14,6 +16,20 @@ logger = logging.getLogger(__name__)
 SESSIONS_FILE = Path(__file__).parent.parent.parent / "data" / "sessions.json"
 
 
+def _status_etag(status: Dict[str, Any]) -> str:
+    """ETag over a last known status snapshot, ignoring its timestamp."""
+    payload = {k: v for k, v in status.items() if k != "_last_updated"}
+    digest = hashlib.blake2b(json.dumps(payload, sort_keys=True).encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+@dataclasses.dataclass
+class _StateChangeWaiters:
+    """Event set on the next state change of a device, with its waiter count."""
+    event: asyncio.Event = dataclasses.field(default_factory=asyncio.Event)
+    count: int = 0
+
+
 class InMemoryStateManager:
     """
     In-memory state manager for tokens and device state.
@@ -23,6 +39,7 @@ class InMemoryStateManager:
     - Device state caching
     - Device password storage (per session)
     - Device connection info caching (for performance)
+    - Partition ID -> protocol index caching (for arm/disarm)
     - Last known alarm state (persistent, no TTL) for connection failure fallback
     - Automatic cleanup of expired entries
     """
@@ -32,10 +49,14 @@ class InMemoryStateManager:
         self._tokens: Dict[str, Dict[str, Any]] = {}
         self._device_state: Dict[str, Dict[str, Any]] = {}
         self._device_passwords: Dict[str, Dict[str, str]] = {}  # session_id -> {device_id: password}
-        self._device_conn_info: Dict[str, Dict[str, Any]] = {}  # device_id -> connection info cache
+        self._device_conn_info: Dict[str, Tuple[Dict[str, Any], datetime]] = {}  # device_id -> (connection info, cached_at)
         self._device_partitions_enabled: Dict[str, bool] = {}  # device_id -> partitions_enabled (from status)
+        self._partition_index: Dict[str, Dict[int, Tuple[Optional[int], datetime]]] = {}  # device_id -> {partition_id: (index, cached_at)}
         self._zone_friendly_names: Dict[str, Dict[int, str]] = {}  # device_id -> {zone_index: friendly_name}
         self._last_known_status: Dict[str, Dict[str, Any]] = {}  # device_id -> last successful status (persistent)
+        self._last_known_etag: Dict[str, str] = {}  # device_id -> ETag of the last known status
+        self._state_change_events: Dict[str, _StateChangeWaiters] = {}  # device_id -> waiters for the next state change
+        self._last_alarm_event: Dict[str, datetime] = {}  # device_id -> when the last alarm event was seen (UTC)
         self._state_ttl = 30  # Device state TTL in seconds
         self._conn_info_ttl = 300  # Connection info TTL in seconds (5 minutes)
         self._cleanup_task: Optional[asyncio.Task] = None
@@ -390,9 +411,7 @@ class InMemoryStateManager:
             conn_info: Connection info dict with mac, use_ip_receiver, etc.
         """
         async with self._lock:
-            conn_copy = conn_info.copy()
-            conn_copy["_cached_at"] = datetime.utcnow().isoformat()
-            self._device_conn_info[str(device_id)] = conn_copy
+            self._device_conn_info[str(device_id)] = (conn_info.copy(), datetime.utcnow())
             logger.debug(f"Cached connection info for device: {device_id}")
 
     async def get_device_conn_info(self, device_id: int) -> Optional[Dict[str, Any]]:
@@ -403,25 +422,25 @@ class InMemoryStateManager:
             device_id: Device identifier
 
         Returns:
-            Connection info dict or None if not found/expired
+            Connection info dict or None if not found/expired. Includes the
+            cached partitions_enabled flag (None if not known) so callers get
+            all device metadata from a single lookup.
         """
         async with self._lock:
-            conn_info = self._device_conn_info.get(str(device_id))
-            if not conn_info:
+            key = str(device_id)
+            entry = self._device_conn_info.get(key)
+            if not entry:
                 return None
 
             # Check if cache is expired
-            cached_at_str = conn_info.get("_cached_at")
-            if cached_at_str:
-                cached_at = datetime.fromisoformat(cached_at_str)
-                if (datetime.utcnow() - cached_at).total_seconds() > self._conn_info_ttl:
-                    # Cache expired
-                    logger.debug(f"Connection info cache expired for device: {device_id}")
-                    return None
+            conn_info, cached_at = entry
+            if (datetime.utcnow() - cached_at).total_seconds() > self._conn_info_ttl:
+                # Cache expired
+                logger.debug(f"Connection info cache expired for device: {device_id}")
+                return None
 
-            # Return copy without internal fields
             result = conn_info.copy()
-            result.pop("_cached_at", None)
+            result["partitions_enabled"] = self._device_partitions_enabled.get(key)
             return result
 
     async def delete_device_conn_info(self, device_id: int) -> None:
@@ -436,6 +455,44 @@ class InMemoryStateManager:
             if key in self._device_conn_info:
                 del self._device_conn_info[key]
                 logger.debug(f"Deleted connection info cache for device: {device_id}")
+            # Partition layout comes from the same cloud record
+            self._partition_index.pop(key, None)
+
+    # Partition index caching (partition API ID -> 0-based protocol index)
+
+    async def set_partition_index(self, device_id: int, partition_id: int, index: Optional[int]) -> None:
+        """
+        Cache the protocol index for a partition.
+
+        Args:
+            device_id: Device identifier
+            partition_id: Partition API ID
+            index: 0-based partition index, or None if the partition byte must be skipped
+        """
+        async with self._lock:
+            self._partition_index.setdefault(str(device_id), {})[partition_id] = (index, datetime.utcnow())
+            logger.debug(f"Cached partition index {partition_id} -> {index} for device: {device_id}")
+
+    async def get_partition_index(self, device_id: int, partition_id: int) -> Tuple[bool, Optional[int]]:
+        """
+        Get cached protocol index for a partition.
+
+        Args:
+            device_id: Device identifier
+            partition_id: Partition API ID
+
+        Returns:
+            Tuple of (found, index). index may be None even when found, meaning
+            the device has a single partition and the partition byte is skipped.
+        """
+        async with self._lock:
+            entry = self._partition_index.get(str(device_id), {}).get(partition_id)
+            if entry is None:
+                return False, None
+            index, cached_at = entry
+            if (datetime.utcnow() - cached_at).total_seconds() > self._conn_info_ttl:
+                return False, None
+            return True, index
 
     # Device partitions_enabled caching (for arm/disarm commands)
 
@@ -561,9 +618,14 @@ class InMemoryStateManager:
         """
         async with self._lock:
             key = str(device_id)
+            previous = self._last_known_status.get(key)
             status_copy = status_data.copy()
             status_copy["_last_updated"] = datetime.utcnow().isoformat()
             self._last_known_status[key] = status_copy
+            # Hash and wake long-poll waiters only when the snapshot changed
+            if previous is None or any(previous.get(k) != v for k, v in status_data.items()):
+                self._last_known_etag[key] = _status_etag(status_copy)
+                self.notify_state_change(device_id)
             self._save_sessions()
             logger.debug(f"Saved last known status for device {device_id}: arm_mode={status_data.get('arm_mode')}")
 
@@ -586,6 +648,27 @@ class InMemoryStateManager:
                 return status.copy()
             return None
 
+    async def get_last_known_etag(self, device_id: int) -> Optional[str]:
+        """
+        Get the ETag of the last known status for a device.
+
+        Computed once per changed snapshot, so long-poll and stream clients
+        can compare against it without re-serializing the status.
+
+        Args:
+            device_id: Device identifier
+
+        Returns:
+            Quoted ETag string, or None if no status is known
+        """
+        async with self._lock:
+            key = str(device_id)
+            etag = self._last_known_etag.get(key)
+            if etag is None and key in self._last_known_status:
+                # Snapshot loaded from file
+                etag = self._last_known_etag[key] = _status_etag(self._last_known_status[key])
+            return etag
+
     async def delete_last_known_status(self, device_id: int) -> None:
         """
         Delete last known status for a device.
@@ -595,11 +678,76 @@ class InMemoryStateManager:
         """
         async with self._lock:
             key = str(device_id)
+            self._last_known_etag.pop(key, None)
             if key in self._last_known_status:
                 del self._last_known_status[key]
                 self._save_sessions()
                 logger.debug(f"Deleted last known status for device {device_id}")
 
 
+    # Alarm event tracking (lets siren-off tell a stale snapshot from a new trigger)
+
+    def mark_alarm_event(self, device_id: Any) -> None:
+        """
+        Record that an alarm (trigger) event was just seen for a device.
+
+        Args:
+            device_id: Device identifier
+        """
+        self._last_alarm_event[str(device_id)] = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    def get_last_alarm_event(self, device_id: Any) -> Optional[datetime]:
+        """
+        Get when the last alarm event was seen for a device.
+
+        Args:
+            device_id: Device identifier
+
+        Returns:
+            Naive UTC datetime of the last alarm event, or None if none was seen
+        """
+        return self._last_alarm_event.get(str(device_id))
+
+    # State change notification (wakes up command verification early)
+
+    def notify_state_change(self, device_id: Any) -> None:
+        """
+        Wake up everyone waiting for a state change on a device.
+
+        Args:
+            device_id: Device identifier
+        """
+        waiters = self._state_change_events.pop(str(device_id), None)
+        if waiters is not None:
+            waiters.event.set()
+
+    async def await_state_change(self, device_id: int, timeout: float) -> bool:
+        """
+        Wait for the next state change reported for a device.
+
+        Args:
+            device_id: Device identifier
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if a state change was reported, False on timeout
+        """
+        key = str(device_id)
+        waiters = self._state_change_events.get(key)
+        if waiters is None:
+            waiters = self._state_change_events[key] = _StateChangeWaiters()
+        waiters.count += 1
+        try:
+            await asyncio.wait_for(waiters.event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            waiters.count -= 1
+            # Leave no stale entry behind once its last waiter is gone
+            if waiters.count == 0 and self._state_change_events.get(key) is waiters:
+                del self._state_change_events[key]
+
+
 # Global state manager instance
 state_manager = InMemoryStateManager()
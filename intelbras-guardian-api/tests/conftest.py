@@ -0,0 +1,16 @@
+"""Shared fixtures for middleware tests."""
+import importlib
+
+import pytest
+
+from app.services.state_manager import InMemoryStateManager
+
+# The package re-exports the singleton under the module's name
+state_manager_module = importlib.import_module("app.services.state_manager")
+
+
+@pytest.fixture
+def state_manager(tmp_path, monkeypatch):
+    """Fresh state manager persisting to a temporary sessions file."""
+    monkeypatch.setattr(state_manager_module, "SESSIONS_FILE", tmp_path / "sessions.json")
+    return InMemoryStateManager()
@@ -0,0 +1,136 @@
+"""Tests for alarm endpoint helpers."""
+import asyncio
+import importlib
+from datetime import datetime, timedelta, timezone
+
+from app.api.v1.alarm import (
+    DeviceConnectionInfo,
+    _await_armed_state,
+    _auto_status_etag,
+    _get_status_coalesced,
+    _last_known_response,
+    _siren_known_off,
+)
+from app.services.isecnet_protocol import AlarmStatus
+
+alarm_module = importlib.import_module("app.api.v1.alarm")
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def test_auto_status_etag_marks_fallback_responses(state_manager, monkeypatch):
+    monkeypatch.setattr(alarm_module, "state_manager", state_manager)
+
+    async def scenario():
+        await state_manager.set_last_known_status(1, {"arm_mode": "disarmed"})
+        snapshot = await state_manager.get_last_known_status(1)
+        etag = await state_manager.get_last_known_etag(1)
+
+        live = _last_known_response(1, snapshot, "ok", connection_unavailable=False)
+        stale = _last_known_response(1, snapshot, "offline", connection_unavailable=True)
+        assert await _auto_status_etag(1, live) == etag
+        assert await _auto_status_etag(1, stale) == etag[:-1] + '-stale"'
+
+    asyncio.run(scenario())
+
+
+def test_status_calls_are_coalesced_per_device_and_password(monkeypatch):
+    calls = []
+
+    class FakeIsecnetClient:
+        async def get_status(self, device_id, password, **kwargs):
+            calls.append((device_id, password))
+            await asyncio.sleep(0.01)
+            return True, AlarmStatus(arm_mode="armed_away", is_armed=True), "ok"
+
+    monkeypatch.setattr(alarm_module, "isecnet_client", FakeIsecnetClient())
+
+    async def scenario():
+        conn_info = DeviceConnectionInfo(mac="AA:BB")
+        results = await asyncio.gather(
+            *(_get_status_coalesced(1, conn_info, "1234") for _ in range(3)),
+            _get_status_coalesced(1, conn_info, "9999"),
+        )
+        assert sorted(calls) == [(1, "1234"), (1, "9999")]
+        assert all(result[0] and result[1].arm_mode == "armed_away" for result in results)
+        assert alarm_module._inflight_status == {}
+
+        await _get_status_coalesced(1, conn_info, "1234")
+        assert len(calls) == 3
+
+    asyncio.run(scenario())
+
+
+def test_cached_conn_info_is_converted_to_the_dataclass(state_manager, monkeypatch):
+    monkeypatch.setattr(alarm_module, "state_manager", state_manager)
+
+    async def scenario():
+        await state_manager.set_device_conn_info(1, {
+            "mac": "AA:BB",
+            "use_ip_receiver": True,
+            "ip_receiver_addr": "10.0.0.2",
+            "ip_receiver_port": 9009,
+            "ip_receiver_account": "1234",
+        })
+        await state_manager.set_device_partitions_enabled(1, False)
+
+        conn_info = await alarm_module._get_device_connection_info("token", 1)
+        assert conn_info == DeviceConnectionInfo(
+            mac="AA:BB",
+            use_ip_receiver=True,
+            ip_receiver_addr="10.0.0.2",
+            ip_receiver_port=9009,
+            ip_receiver_account="1234",
+            partitions_enabled=False,
+        )
+        assert conn_info.ipr_kwargs["ip_receiver_addr"] == "10.0.0.2"
+
+    asyncio.run(scenario())
+
+
+def test_await_armed_state_ignores_unrelated_changes(state_manager, monkeypatch):
+    monkeypatch.setattr(alarm_module, "state_manager", state_manager)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        waiter = asyncio.ensure_future(_await_armed_state(1, 0.2))
+        await asyncio.sleep(0)
+        state_manager.notify_state_change(1)
+        await waiter
+        assert loop.time() - started >= 0.2
+
+    asyncio.run(scenario())
+
+
+def test_await_armed_state_returns_once_armed(state_manager, monkeypatch):
+    monkeypatch.setattr(alarm_module, "state_manager", state_manager)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        waiter = asyncio.ensure_future(_await_armed_state(1, 1.0))
+        await asyncio.sleep(0)
+        await state_manager.set_last_known_status(1, {"arm_mode": "armed_away"})
+        await waiter
+        assert loop.time() - started < 0.5
+
+    asyncio.run(scenario())
+
+
+def test_siren_known_off(state_manager, monkeypatch):
+    monkeypatch.setattr(alarm_module, "state_manager", state_manager)
+    recent = {"is_triggered": False, "_last_updated": _utc_now().isoformat()}
+
+    assert _siren_known_off(1, recent)
+    assert not _siren_known_off(1, None)
+    assert not _siren_known_off(1, {**recent, "is_triggered": True})
+    assert not _siren_known_off(1, {"is_triggered": False})
+    stale = (_utc_now() - timedelta(seconds=30)).isoformat()
+    assert not _siren_known_off(1, {**recent, "_last_updated": stale})
+
+    # An alarm event after the snapshot means it can't be trusted any more
+    state_manager.mark_alarm_event(1)
+    assert not _siren_known_off(1, recent)
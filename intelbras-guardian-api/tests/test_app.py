@@ -0,0 +1,9 @@
+"""Import smoke test for the FastAPI application."""
+
+
+def test_app_imports_and_registers_routes():
+    from app.main import app
+
+    paths = app.openapi()["paths"]
+    assert "/api/v1/alarm/{device_id}/status" in paths
+    assert "/api/v1/alarm/{device_id}/siren/off" in paths
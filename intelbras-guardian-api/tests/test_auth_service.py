@@ -0,0 +1,60 @@
+"""Tests for the validated-token memo in the auth service."""
+import asyncio
+import importlib
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.exceptions import InvalidSessionError
+from app.services.auth_service import AuthService
+
+auth_module = importlib.import_module("app.services.auth_service")
+
+
+def _token_data(access_token: str) -> dict:
+    expires_at = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+    return {"access_token": access_token, "expires_at": expires_at.isoformat()}
+
+
+def test_valid_token_is_memoized_until_logout(state_manager, monkeypatch):
+    monkeypatch.setattr(auth_module, "state_manager", state_manager)
+    lookups = []
+    get_token = state_manager.get_token
+
+    async def counting_get_token(session_id):
+        lookups.append(session_id)
+        return await get_token(session_id)
+
+    monkeypatch.setattr(state_manager, "get_token", counting_get_token)
+
+    async def scenario():
+        service = AuthService()
+        await state_manager.set_token("session-1", _token_data("token-a"))
+
+        assert await service.get_valid_token("session-1") == "token-a"
+        assert await service.get_valid_token("session-1") == "token-a"
+        assert lookups == ["session-1"]
+
+        await service.logout("session-1")
+        with pytest.raises(InvalidSessionError):
+            await service.get_valid_token("session-1")
+
+    asyncio.run(scenario())
+
+
+def test_stale_memo_entries_are_evicted(state_manager, monkeypatch):
+    monkeypatch.setattr(auth_module, "state_manager", state_manager)
+
+    async def scenario():
+        service = AuthService()
+        await state_manager.set_token("session-1", _token_data("token-a"))
+        await state_manager.set_token("session-2", _token_data("token-b"))
+
+        await service.get_valid_token("session-1")
+        validated_at, token = service._valid_tokens["session-1"]
+        service._valid_tokens["session-1"] = (validated_at - auth_module._VALID_TOKEN_TTL, token)
+
+        await service.get_valid_token("session-2")
+        assert set(service._valid_tokens) == {"session-2"}
+
+    asyncio.run(scenario())
@@ -0,0 +1,64 @@
+"""Tests for SSE client queues and event broadcast."""
+import asyncio
+import importlib
+
+from app.services.event_stream import EventStreamManager, SSEClient, _CLIENT_QUEUE_SIZE
+
+event_stream_module = importlib.import_module("app.services.event_stream")
+
+
+def test_push_drops_oldest_when_full():
+    async def scenario():
+        client = SSEClient(session_id="s")
+        for i in range(_CLIENT_QUEUE_SIZE + 2):
+            client.push({"n": i})
+
+        assert client.queue.qsize() == _CLIENT_QUEUE_SIZE
+        assert client.queue.get_nowait() == {"n": 2}
+
+    asyncio.run(scenario())
+
+
+def test_broadcast_reaches_clients_and_wakes_waiters(state_manager, monkeypatch):
+    monkeypatch.setattr(event_stream_module, "state_manager", state_manager)
+
+    async def scenario():
+        manager = EventStreamManager()
+        client = SSEClient(session_id="s")
+        manager._clients["c"] = client
+
+        waiter = asyncio.ensure_future(state_manager.await_state_change(7, 1.0))
+        await asyncio.sleep(0)
+        await manager.broadcast_event({"device_id": 7, "is_alarm": False}, event_type="alarm_event")
+
+        assert await waiter is True
+        assert client.queue.get_nowait() == {
+            "type": "alarm_event",
+            "data": {"device_id": 7, "is_alarm": False},
+        }
+        assert state_manager.get_last_alarm_event(7) is None
+
+    asyncio.run(scenario())
+
+
+def test_broadcast_of_alarm_event_is_recorded(state_manager, monkeypatch):
+    monkeypatch.setattr(event_stream_module, "state_manager", state_manager)
+
+    async def scenario():
+        await EventStreamManager().broadcast_event({"device_id": 7, "is_alarm": True})
+
+    asyncio.run(scenario())
+    assert state_manager.get_last_alarm_event(7) is not None
+
+
+def test_parse_event_flags_alarms():
+    parsed = EventStreamManager()._parse_event({
+        "id": 1,
+        "event": {"id": 3, "name": "Disparo de zona"},
+        "alarm_central_id": 7,
+    })
+
+    assert parsed["is_alarm"] is True
+    assert parsed["severity"] == "critical"
+    assert parsed["device_id"] == 7
+    assert parsed["zone"] is None
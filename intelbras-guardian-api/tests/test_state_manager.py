@@ -0,0 +1,131 @@
+"""Tests for the in-memory state manager caches and state change signalling."""
+import asyncio
+from datetime import datetime, timezone
+
+
+def test_last_known_status_notifies_only_on_change(state_manager):
+    async def scenario():
+        await state_manager.set_last_known_status(1, {"arm_mode": "disarmed"})
+
+        waiter = asyncio.ensure_future(state_manager.await_state_change(1, 0.05))
+        await asyncio.sleep(0)
+        await state_manager.set_last_known_status(1, {"arm_mode": "disarmed"})
+        assert await waiter is False
+
+        waiter = asyncio.ensure_future(state_manager.await_state_change(1, 1.0))
+        await asyncio.sleep(0)
+        await state_manager.set_last_known_status(1, {"arm_mode": "armed_away"})
+        assert await waiter is True
+
+    asyncio.run(scenario())
+
+
+def test_last_known_etag_follows_snapshot_content(state_manager):
+    async def scenario():
+        assert await state_manager.get_last_known_etag(1) is None
+
+        await state_manager.set_last_known_status(1, {"arm_mode": "disarmed"})
+        first = await state_manager.get_last_known_etag(1)
+        # A new timestamp alone doesn't change the tag
+        await state_manager.set_last_known_status(1, {"arm_mode": "disarmed"})
+        assert await state_manager.get_last_known_etag(1) == first
+
+        await state_manager.set_last_known_status(1, {"arm_mode": "armed_away"})
+        assert await state_manager.get_last_known_etag(1) != first
+
+        await state_manager.delete_last_known_status(1)
+        assert await state_manager.get_last_known_etag(1) is None
+
+    asyncio.run(scenario())
+
+
+def test_last_known_etag_for_snapshot_loaded_from_file(state_manager):
+    async def scenario():
+        await state_manager.set_last_known_status(1, {"arm_mode": "disarmed"})
+        etag = await state_manager.get_last_known_etag(1)
+
+        state_manager._last_known_etag.clear()
+        assert await state_manager.get_last_known_etag(1) == etag
+
+    asyncio.run(scenario())
+
+
+def test_conn_info_expires_after_ttl(state_manager):
+    async def scenario():
+        await state_manager.set_device_conn_info(1, {"mac": "AA:BB"})
+        assert await state_manager.get_device_conn_info(1) == {"mac": "AA:BB", "partitions_enabled": None}
+
+        state_manager._conn_info_ttl = -1
+        assert await state_manager.get_device_conn_info(1) is None
+
+    asyncio.run(scenario())
+
+
+def test_conn_info_carries_partitions_enabled(state_manager):
+    async def scenario():
+        conn_info = {"mac": "AA:BB", "use_ip_receiver": False}
+        await state_manager.set_device_conn_info(1, conn_info)
+        await state_manager.set_device_partitions_enabled(1, True)
+
+        cached = await state_manager.get_device_conn_info(1)
+        assert cached == {"mac": "AA:BB", "use_ip_receiver": False, "partitions_enabled": True}
+        # Callers get a copy, never the cached entry or the stored argument
+        cached["mac"] = "CC:DD"
+        conn_info["mac"] = "EE:FF"
+        assert (await state_manager.get_device_conn_info(1))["mac"] == "AA:BB"
+
+    asyncio.run(scenario())
+
+
+def test_partition_index(state_manager):
+    async def scenario():
+        assert await state_manager.get_partition_index(1, 10) == (False, None)
+
+        await state_manager.set_partition_index(1, 10, 0)
+        await state_manager.set_partition_index(1, 11, None)
+        assert await state_manager.get_partition_index(1, 10) == (True, 0)
+        # None is a cached answer (single-partition device), not a miss
+        assert await state_manager.get_partition_index(1, 11) == (True, None)
+
+        await state_manager.delete_device_conn_info(1)
+        assert await state_manager.get_partition_index(1, 10) == (False, None)
+
+    asyncio.run(scenario())
+
+
+def test_await_state_change_wakes_on_notify(state_manager):
+    async def scenario():
+        waiter = asyncio.ensure_future(state_manager.await_state_change(1, 1.0))
+        await asyncio.sleep(0)
+        state_manager.notify_state_change("1")
+        assert await waiter is True
+        assert state_manager._state_change_events == {}
+
+    asyncio.run(scenario())
+
+
+def test_await_state_change_times_out(state_manager):
+    async def scenario():
+        assert await state_manager.await_state_change(1, 0.01) is False
+        assert state_manager._state_change_events == {}
+
+    asyncio.run(scenario())
+
+
+def test_await_state_change_timeout_keeps_other_waiters(state_manager):
+    async def scenario():
+        long_waiter = asyncio.ensure_future(state_manager.await_state_change(1, 1.0))
+        await asyncio.sleep(0)
+        assert await state_manager.await_state_change(1, 0.01) is False
+
+        # The long waiter must still be woken by the next notification
+        state_manager.notify_state_change(1)
+        assert await long_waiter is True
+
+    asyncio.run(scenario())
+
+
+def test_alarm_event_tracking(state_manager):
+    assert state_manager.get_last_alarm_event(1) is None
+    state_manager.mark_alarm_event("1")
+    assert state_manager.get_last_alarm_event(1) <= datetime.now(timezone.utc).replace(tzinfo=None)